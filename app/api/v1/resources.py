@@ -48,8 +48,8 @@ def get_dashboard():
         {
             "grouped_sessions": [
                 {
-                    "patient_id": person[0],
-                    "patient_name": person[1],
+                    "patient_id": person_id,
+                    "patient_name": name,
                     "sessions": [
                         {
                             "id": s[0],
@@ -60,7 +60,7 @@ def get_dashboard():
                         for s in sessions
                     ],
                 }
-                for person, sessions in data["grouped_sessions"].items()
+                for person_id, name, sessions in data["persons"]
             ],
             "total": data["total"],
             "current_filter": show_filter,
@@ -13,6 +13,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 from sqlalchemy.pool import NullPool
 
+from app.utils.serializers import dumps_json
+
 # Base directory of the application
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -43,6 +45,7 @@ class Config:
     SQLALCHEMY_ECHO = False
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,  # Verify connections before use
+        "json_serializer": dumps_json,  # orjson-backed encoding for JSON columns
     }
 
     # Session security
@@ -131,8 +134,11 @@ class TestingConfig(Config):
     # Relaxed session protection for testing
     SESSION_PROTECTION = "basic"
 
-    # Fast password hashing for tests
-    BCRYPT_LOG_ROUNDS = 4
+    # Fast password hashing for tests (check_password reads the method from the hash)
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+
+    # DEBUG would otherwise make Jinja stat every template on each render
+    TEMPLATES_AUTO_RELOAD = False
 
     # Test-specific settings
     SERVER_NAME = "localhost"
@@ -150,11 +156,14 @@ class ProductionConfig(Config):
         or f"sqlite:///{BASE_DIR / 'instance' / 'database.db'}"
     )
 
-    # Connection pooling for production
+    # Connection pooling for production (per gunicorn worker process)
     SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_size": 10,
+        "pool_size": int(os.environ.get("DB_POOL_SIZE", 10)),
+        "max_overflow": int(os.environ.get("DB_MAX_OVERFLOW", 10)),
+        "pool_timeout": int(os.environ.get("DB_POOL_TIMEOUT", 30)),
         "pool_recycle": 3600,
         "pool_pre_ping": True,
+        "json_serializer": dumps_json,
     }
 
     # Strict session security
@@ -195,6 +204,7 @@ class VercelConfig(ProductionConfig):
     SQLALCHEMY_ENGINE_OPTIONS = {
         "pool_pre_ping": True,
         "poolclass": NullPool,
+        "json_serializer": dumps_json,
     }
 
     # Vercel captures stdout/stderr automatically — no file needed
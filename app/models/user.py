@@ -5,6 +5,7 @@ User model for authentication and authorization.
 from datetime import datetime
 from typing import List, Optional
 
+from flask import current_app, has_app_context
 from flask_login import UserMixin
 from werkzeug.security import check_password_hash, generate_password_hash
 
@@ -45,10 +46,17 @@ class User(UserMixin, TimestampMixin, SoftDeleteMixin, db.Model):
         """
         Hash and store password.
 
+        Uses the PASSWORD_HASH_METHOD config value when set, otherwise
+        Werkzeug's default (scrypt).
+
         Args:
             password: Plain text password to hash
         """
-        self.password_hash = generate_password_hash(password)
+        method = current_app.config.get("PASSWORD_HASH_METHOD") if has_app_context() else None
+        if method:
+            self.password_hash = generate_password_hash(password, method=method)
+        else:
+            self.password_hash = generate_password_hash(password)
 
     def check_password(self, password: str) -> bool:
         """
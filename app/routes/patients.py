@@ -26,7 +26,7 @@ def index():
 
     return render_template(
         "patients/list.html",
-        grouped_sessions=data["grouped_sessions"],
+        persons=data["persons"],
         filters=FILTERS,
         allow_delete=ALLOW_DELETE,
         show=show_filter,
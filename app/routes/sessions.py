@@ -7,7 +7,6 @@ Handles creating, editing, deleting, and payment tracking of therapy sessions.
 from flask import Blueprint, flash, redirect, render_template, request, url_for
 from flask_login import current_user, login_required
 
-from app.services.patient_service import PatientService
 from app.services.session_service import SessionService
 from app.utils.constants import FlashCategory
 from app.validators.forms import (
@@ -24,10 +23,7 @@ sessions_bp = Blueprint("sessions", __name__)
 @login_required
 def add_session():
     """Add a new therapy session."""
-    form = SessionForm()
-
-    # Populate patient choices
-    form.person_id.choices = PatientService.get_for_select()
+    form = SessionForm.with_person_choices()
 
     if not form.person_id.choices:
         flash("Primero debes agregar un paciente.", FlashCategory.WARNING)
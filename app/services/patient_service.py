@@ -5,11 +5,11 @@ Handles creation, update, deletion, and querying of patients.
 """
 
 import logging
-from collections import defaultdict
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
 from flask import request
+from sqlalchemy import func
 
 from app.extensions import db
 from app.models.audit_log import AuditLog
@@ -55,11 +55,13 @@ class PatientService:
         """
         Get patients formatted for select dropdown.
 
+        Selects only the id and name columns, so no Person objects are built.
+
         Returns:
             List of tuples (id, name)
         """
-        persons = Person.get_all_active().all()
-        return [(p.id, p.name) for p in persons]
+        rows = Person.get_all_active().with_entities(Person.id, Person.name).all()
+        return [(row.id, row.name) for row in rows]
 
     @staticmethod
     def create(
@@ -186,12 +188,28 @@ class PatientService:
 
         try:
             old_values = person.to_dict()
+            ip_address = request.remote_addr if request else None
 
             if soft:
-                # Soft delete person and sessions
+                # Soft delete person and sessions; already-deleted sessions keep
+                # their original deleted_at and are not audited again
                 person.soft_delete(user_id)
-                for session in person.therapy_sessions:
+                session_events = []
+                for session in person.therapy_sessions.filter(TherapySession.deleted_at.is_(None)):
                     session.soft_delete(user_id)
+                    session_events.append(
+                        {
+                            "action": AuditAction.SOFT_DELETE,
+                            "table_name": "therapy_sessions",
+                            "record_id": session.id,
+                            "user_id": user_id,
+                            "ip_address": ip_address,
+                        }
+                    )
+
+                # One batched INSERT for the cascaded session audit entries
+                if session_events:
+                    db.session.bulk_insert_mappings(AuditLog, session_events)
             else:
                 # Hard delete (cascade will delete sessions)
                 db.session.delete(person)
@@ -206,7 +224,7 @@ class PatientService:
                 record_id=person_id,
                 old_values=old_values,
                 user_id=user_id,
-                ip_address=request.remote_addr if request else None,
+                ip_address=ip_address,
             )
 
             logger.info(f"Patient deleted: ID {person_id} (soft={soft})")
@@ -268,9 +286,10 @@ class PatientService:
             show_filter: Filter for sessions ('all', 'pending', 'paid')
 
         Returns:
-            Dictionary with grouped_sessions, total, filter info
+            Dictionary with persons as (id, name, sessions) tuples, total, filter info
         """
-        # Build base query
+        # Build base query; the window count returns the session total on
+        # every row so no separate aggregate query is needed
         query = (
             db.session.query(
                 Person.id,
@@ -279,6 +298,7 @@ class PatientService:
                 TherapySession.session_date,
                 TherapySession.session_price,
                 TherapySession.pending,
+                func.count(TherapySession.id).over().label("total"),
             )
             .outerjoin(
                 TherapySession,
@@ -299,28 +319,31 @@ class PatientService:
         # Order by name and date
         query = query.order_by(Person.name, TherapySession.session_date)
 
-        # Group data
-        grouped_sessions = defaultdict(list)
+        # Group data into parallel lists; rows are ordered by (unique) name,
+        # so each patient's rows arrive contiguously
+        person_ids = []
+        names = []
+        session_lists = []
         total = 0
 
-        for person_id, name, session_id, date, price, pending in query.all():
-            grouped_session_key = (person_id, name)
+        for person_id, name, session_id, date, price, pending, total in query.all():
+            if not person_ids or person_ids[-1] != person_id:
+                person_ids.append(person_id)
+                names.append(name)
+                session_lists.append([])
 
             if date and price:
-                total += 1
-                session_data = (
-                    session_id,
-                    format_date(date) if date else "",
-                    format_price(price) if price else "",
-                    pending,
+                session_lists[-1].append(
+                    (
+                        session_id,
+                        format_date(date),
+                        format_price(price),
+                        pending,
+                    )
                 )
-                grouped_sessions[grouped_session_key].append(session_data)
-            elif person_id not in [k[0] for k in grouped_sessions.keys()]:
-                # Include patients with no sessions
-                grouped_sessions[grouped_session_key] = []
 
         return {
-            "grouped_sessions": dict(grouped_sessions),
+            "persons": list(zip(person_ids, names, session_lists)),
             "total": total,
             "filter": show_filter,
         }
@@ -4,13 +4,78 @@ Custom decorators for routes and functions.
 Provides authentication, authorization, and utility decorators.
 """
 
+import logging
 from functools import wraps
 
 from flask import abort, current_app, flash, redirect, request, url_for
 from flask_login import current_user
+from werkzeug.exceptions import HTTPException
 
 from app.utils.constants import FlashCategory, UserRole
 
+# Flash messages shared by every decorated route
+_MSG_LOGIN = "Ingresa con tu usuario para ver esta página."
+_MSG_CONFIRM = "Por favor confirma tu email antes de continuar."
+
+
+def _login_redirect():
+    """Redirect to the login page, keeping the current URL as ``next``."""
+    return redirect(url_for("auth.login", next=request.url))
+
+
+def _require(*, admin=False, roles=None, confirmed=False):
+    """
+    Build an access-control decorator that performs every check in one wrapper.
+
+    Stacking separate decorators costs one Python frame (and one repeated
+    authentication check) per layer, so all checks run inline here.
+
+    Args:
+        admin: Require the admin role
+        roles: Optional frozenset of accepted roles
+        confirmed: Require a confirmed email (when the user model supports it)
+    """
+
+    # Bind the helpers as closure variables so the per-request wrapper reads
+    # cells instead of module globals
+    _flash, _redirect, _abort, _current_user = flash, redirect, abort, current_user
+    _warning = FlashCategory.WARNING
+    roles_text = ", ".join(sorted(roles)) if roles is not None else ""
+
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            # Resolve the current_user proxy once instead of on every attribute access
+            user = _current_user._get_current_object()
+
+            if not user.is_authenticated:
+                _flash(_MSG_LOGIN, _warning)
+                return _login_redirect()
+
+            if admin and not user.is_admin:
+                current_app.logger.warning("Unauthorized admin access attempt by user %s", user.id)
+                _abort(403)
+
+            if roles is not None and user.role not in roles:
+                current_app.logger.warning(
+                    "Unauthorized access attempt by user %s (required roles: %s, user role: %s)",
+                    user.id,
+                    roles_text,
+                    user.role,
+                )
+                _abort(403)
+
+            # Users without an is_confirmed attribute count as confirmed
+            if confirmed and not getattr(user, "is_confirmed", True):
+                _flash(_MSG_CONFIRM, _warning)
+                return _redirect(url_for("auth.unconfirmed"))
+
+            return f(*args, **kwargs)
+
+        return decorated_function
+
+    return decorator
+
 
 def login_required_custom(f):
     """
@@ -19,15 +84,7 @@ def login_required_custom(f):
     Note: Prefer using flask_login.login_required instead.
     This is kept for backward compatibility.
     """
-
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash("Ingresa con tu usuario para ver esta página.", FlashCategory.WARNING)
-            return redirect(url_for("auth.login", next=request.url))
-        return f(*args, **kwargs)
-
-    return decorated_function
+    return _require()(f)
 
 
 def admin_required(f):
@@ -36,20 +93,7 @@ def admin_required(f):
 
     Returns 403 Forbidden if user is not an admin.
     """
-
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash("Ingresa con tu usuario para ver esta página.", FlashCategory.WARNING)
-            return redirect(url_for("auth.login", next=request.url))
-
-        if not current_user.is_admin:
-            current_app.logger.warning(f"Unauthorized admin access attempt by user {current_user.id}")
-            abort(403)
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+    return _require(admin=True)(f)
 
 
 def role_required(*roles):
@@ -64,29 +108,7 @@ def role_required(*roles):
         def some_route():
             pass
     """
-
-    def decorator(f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if not current_user.is_authenticated:
-                flash(
-                    "Ingresa con tu usuario para ver esta página.",
-                    FlashCategory.WARNING,
-                )
-                return redirect(url_for("auth.login", next=request.url))
-
-            if not current_user.has_any_role(*roles):
-                current_app.logger.warning(
-                    f"Unauthorized access attempt by user {current_user.id} "
-                    f"(required roles: {roles}, user role: {current_user.role})"
-                )
-                abort(403)
-
-            return f(*args, **kwargs)
-
-        return decorated_function
-
-    return decorator
+    return _require(roles=frozenset(roles))
 
 
 def confirmed_required(f):
@@ -95,20 +117,7 @@ def confirmed_required(f):
 
     Redirects to confirmation page if email is not confirmed.
     """
-
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
-            flash("Ingresa con tu usuario para ver esta página.", FlashCategory.WARNING)
-            return redirect(url_for("auth.login", next=request.url))
-
-        if hasattr(current_user, "is_confirmed") and not current_user.is_confirmed:
-            flash("Por favor confirma tu email antes de continuar.", FlashCategory.WARNING)
-            return redirect(url_for("auth.unconfirmed"))
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+    return _require(confirmed=True)(f)
 
 
 def log_activity(action: str):
@@ -127,10 +136,16 @@ def log_activity(action: str):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            user_id = current_user.id if current_user.is_authenticated else "anonymous"
-            current_app.logger.info(
-                f"Activity: {action} | User: {user_id} | " f"Path: {request.path} | Method: {request.method}"
-            )
+            logger = current_app.logger
+            if logger.isEnabledFor(logging.INFO):
+                user_id = current_user.id if current_user.is_authenticated else "anonymous"
+                logger.info(
+                    "Activity: %s | User: %s | Path: %s | Method: %s",
+                    action,
+                    user_id,
+                    request.path,
+                    request.method,
+                )
             return f(*args, **kwargs)
 
         return decorated_function
@@ -143,14 +158,18 @@ def handle_exceptions(f):
     Handle exceptions gracefully with logging and user-friendly messages.
 
     Catches exceptions, logs them, and shows a flash message.
+    HTTP exceptions (e.g. abort(404)) are re-raised untouched.
     """
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
         try:
             return f(*args, **kwargs)
+        except HTTPException:
+            # abort()/HTTP errors are handled by Flask's error handlers
+            raise
         except Exception as e:
-            current_app.logger.error(f"Exception in {f.__name__}: {str(e)}", exc_info=True)
+            current_app.logger.error("Exception in %s: %s", f.__name__, e, exc_info=True)
             flash("Ocurrió un error. Por favor intente nuevamente.", FlashCategory.ERROR)
             return redirect(request.referrer or url_for("main.index"))
 
@@ -6,10 +6,20 @@ All date formatting uses explicit Spanish names to ensure consistency across sys
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Union
 
 from app.utils.constants import DATE_FORMAT_INPUT, SPANISH_DAYS, SPANISH_MONTHS
 
+# Immutable copy indexed by weekday() (Monday = 0)
+_WEEKDAYS = tuple(SPANISH_DAYS)
+
+
+@lru_cache(maxsize=1024)
+def _parse_ymd(date_str: str) -> datetime:
+    """Parse a YYYY-MM-DD string, memoized since the same dates repeat across a list."""
+    return datetime.strptime(date_str, DATE_FORMAT_INPUT)
+
 
 def format_date(date_input: Union[str, datetime, None], include_weekday: bool = True) -> str:
     """
@@ -27,17 +37,17 @@ def format_date(date_input: Union[str, datetime, None], include_weekday: bool =
 
     if isinstance(date_input, str):
         try:
-            date_obj = datetime.strptime(date_input, DATE_FORMAT_INPUT)
+            date_obj = _parse_ymd(date_input)
         except ValueError:
             return date_input  # Return as-is if parsing fails
     else:
         date_obj = date_input
 
+    # Build the string from date attributes instead of strftime format parsing
     if include_weekday:
-        weekday = SPANISH_DAYS[date_obj.weekday()]
-        return f"{weekday} {date_obj.strftime('%d/%m/%Y')}"
+        return f"{_WEEKDAYS[date_obj.weekday()]} {date_obj.day:02d}/{date_obj.month:02d}/{date_obj.year:04d}"
     else:
-        return date_obj.strftime("%d/%m/%Y")
+        return f"{date_obj.day:02d}/{date_obj.month:02d}/{date_obj.year:04d}"
 
 
 def format_price(price: Union[float, int, str, None]) -> str:
@@ -55,10 +65,39 @@ def format_price(price: Union[float, int, str, None]) -> str:
 
     try:
         numeric_price = float(price)
-        return f"${numeric_price:,.2f}"
     except (ValueError, TypeError):
         return f"${price}"
 
+    try:
+        cents = int(round(numeric_price * 100))
+    except (ValueError, OverflowError):
+        cents = None  # NaN/infinity
+
+    # Fast path for whole-cent amounts (every stored price); anything with
+    # sub-cent precision keeps the generic formatter's rounding
+    if cents is not None and cents / 100 == numeric_price:
+        return _format_cents(cents)
+    return f"${numeric_price:,.2f}"
+
+
+@lru_cache(maxsize=512)
+def _format_cents(cents: int) -> str:
+    """
+    Format an integer amount of cents as a price (e.g., 123456 -> "$1,234.56").
+
+    Memoized since the same prices repeat heavily across a session list.
+    """
+    sign = "-" if cents < 0 else ""
+    units, frac = divmod(abs(cents), 100)
+
+    groups = []
+    while units >= 1000:
+        units, group = divmod(units, 1000)
+        groups.append(f"{group:03d}")
+    groups.append(str(units))
+
+    return f"${sign}{','.join(reversed(groups))}.{frac:02d}"
+
 
 def format_percentage(value: Union[float, int], decimal_places: int = 1) -> str:
     """
@@ -72,6 +111,9 @@ def format_percentage(value: Union[float, int], decimal_places: int = 1) -> str:
         Formatted percentage string (e.g., "75.5%")
     """
     try:
+        # Default precision uses a fixed spec instead of building one at runtime
+        if decimal_places == 1:
+            return f"{float(value):.1f}%"
         return f"{float(value):.{decimal_places}f}%"
     except (ValueError, TypeError):
         return "0%"
@@ -89,10 +131,11 @@ def truncate_text(text: str, max_length: int = 50, suffix: str = "...") -> str:
     Returns:
         Truncated text with suffix if needed
     """
+    # Short text (the common case) is returned as-is without any allocation
     if not text or len(text) <= max_length:
         return text
 
-    return text[: max_length - len(suffix)] + suffix
+    return f"{text[: max_length - len(suffix)]}{suffix}"
 
 
 def format_datetime(dt: Union[datetime, None]) -> str:
@@ -108,4 +151,4 @@ def format_datetime(dt: Union[datetime, None]) -> str:
     if dt is None:
         return ""
 
-    return dt.strftime("%d/%m/%Y %H:%M")
+    return f"{dt.day:02d}/{dt.month:02d}/{dt.year:04d} {dt.hour:02d}:{dt.minute:02d}"
@@ -0,0 +1,33 @@
+"""
+JSON serialization helpers.
+
+Uses orjson (C extension) when installed and falls back to the standard
+library otherwise, so the application runs with either.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def dumps_json(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Used as the SQLAlchemy engine ``json_serializer`` so JSON columns
+    (e.g. AuditLog.old_values/new_values) are encoded by orjson.
+
+    Args:
+        obj: JSON-compatible object (dict, list, str, number, bool, None)
+
+    Returns:
+        JSON document as a string
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies int/bool/None keys like json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
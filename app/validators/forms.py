@@ -4,6 +4,7 @@ Flask-WTF forms for all application operations.
 All forms include CSRF protection and validation.
 """
 
+from flask import g
 from flask_wtf import FlaskForm
 from wtforms import (
     BooleanField,
@@ -26,12 +27,39 @@ from wtforms.validators import (
 )
 
 from app.utils.constants import (
+    ALL_FILTER,
     MAX_NAME_LENGTH,
     MAX_PRICE,
     MIN_PASSWORD_LENGTH,
     MIN_PRICE,
+    PAID_FILTER,
+    PENDING_FILTER,
+    UserRole,
 )
 
+# Validation messages shared by several forms
+_MSG_EMAIL_REQUIRED = "El email es requerido."
+_MSG_EMAIL_INVALID = "Ingresa un email válido."
+_MSG_PASSWORD_LENGTH = f"La contraseña debe tener al menos {MIN_PASSWORD_LENGTH} caracteres."
+_MSG_PASSWORDS_MATCH = "Las contraseñas deben coincidir."
+_MSG_DATE_REQUIRED = "La fecha es requerida."
+_MSG_PRICE_REQUIRED = "El precio es requerido."
+_MSG_PRICE_RANGE = f"El precio debe estar entre ${MIN_PRICE} y ${MAX_PRICE:,.0f}."
+_MSG_SESSION_NOTES_LENGTH = "Las notas son demasiado largas (máximo 500 caracteres)."
+
+# Static select choices, built once at import
+_FILTER_CHOICES = (
+    (ALL_FILTER, "Todos"),
+    (PENDING_FILTER, "Pendientes"),
+    (PAID_FILTER, "Pagados"),
+)
+_ROLE_CHOICES = (
+    (UserRole.THERAPIST, "Terapeuta"),
+    (UserRole.ADMIN, "Administrador"),
+    (UserRole.VIEWER, "Solo Lectura"),
+)
+_VALID_ROLES = frozenset(value for value, _ in _ROLE_CHOICES)
+
 # =============================================================================
 # Authentication Forms
 # =============================================================================
@@ -43,8 +71,8 @@ class LoginForm(FlaskForm):
     email = StringField(
         "Email",
         validators=[
-            DataRequired(message="El email es requerido."),
-            Email(message="Ingresa un email válido."),
+            DataRequired(message=_MSG_EMAIL_REQUIRED),
+            Email(message=_MSG_EMAIL_INVALID),
         ],
     )
     password = PasswordField("Contraseña", validators=[DataRequired(message="La contraseña es requerida.")])
@@ -57,8 +85,8 @@ class RegistrationForm(FlaskForm):
     email = StringField(
         "Email",
         validators=[
-            DataRequired(message="El email es requerido."),
-            Email(message="Ingresa un email válido."),
+            DataRequired(message=_MSG_EMAIL_REQUIRED),
+            Email(message=_MSG_EMAIL_INVALID),
             Length(max=255, message="El email es demasiado largo."),
         ],
     )
@@ -68,7 +96,7 @@ class RegistrationForm(FlaskForm):
             DataRequired(message="La contraseña es requerida."),
             Length(
                 min=MIN_PASSWORD_LENGTH,
-                message=f"La contraseña debe tener al menos {MIN_PASSWORD_LENGTH} caracteres.",
+                message=_MSG_PASSWORD_LENGTH,
             ),
         ],
     )
@@ -76,7 +104,7 @@ class RegistrationForm(FlaskForm):
         "Confirmar Contraseña",
         validators=[
             DataRequired(message="Confirma tu contraseña."),
-            EqualTo("password", message="Las contraseñas deben coincidir."),
+            EqualTo("password", message=_MSG_PASSWORDS_MATCH),
         ],
     )
 
@@ -84,9 +112,11 @@ class RegistrationForm(FlaskForm):
         """Custom password strength validation."""
         password = field.data
         if password:
-            # Check for at least one letter and one number
-            has_letter = any(c.isalpha() for c in password)
-            has_number = any(c.isdigit() for c in password)
+            # Check for at least one letter and one number; map() runs the str
+            # methods from C and stops at the first match. Letters stay
+            # Unicode-aware (ñ, á, ...), unlike an ASCII-only set test.
+            has_letter = any(map(str.isalpha, password))
+            has_number = any(map(str.isdigit, password))
 
             if not (has_letter and has_number):
                 raise ValidationError("La contraseña debe contener al menos una letra y un número.")
@@ -98,8 +128,8 @@ class ResetPasswordRequestForm(FlaskForm):
     email = StringField(
         "Email",
         validators=[
-            DataRequired(message="El email es requerido."),
-            Email(message="Ingresa un email válido."),
+            DataRequired(message=_MSG_EMAIL_REQUIRED),
+            Email(message=_MSG_EMAIL_INVALID),
         ],
     )
 
@@ -110,8 +140,8 @@ class ResetPasswordForm(FlaskForm):
     email = StringField(
         "Email",
         validators=[
-            DataRequired(message="El email es requerido."),
-            Email(message="Ingresa un email válido."),
+            DataRequired(message=_MSG_EMAIL_REQUIRED),
+            Email(message=_MSG_EMAIL_INVALID),
         ],
     )
     new_password = PasswordField(
@@ -120,7 +150,7 @@ class ResetPasswordForm(FlaskForm):
             DataRequired(message="La nueva contraseña es requerida."),
             Length(
                 min=MIN_PASSWORD_LENGTH,
-                message=f"La contraseña debe tener al menos {MIN_PASSWORD_LENGTH} caracteres.",
+                message=_MSG_PASSWORD_LENGTH,
             ),
         ],
     )
@@ -128,7 +158,7 @@ class ResetPasswordForm(FlaskForm):
         "Confirmar Contraseña",
         validators=[
             DataRequired(message="Confirma tu contraseña."),
-            EqualTo("new_password", message="Las contraseñas deben coincidir."),
+            EqualTo("new_password", message=_MSG_PASSWORDS_MATCH),
         ],
     )
     security = StringField(
@@ -150,7 +180,7 @@ class ChangePasswordForm(FlaskForm):
             DataRequired(message="La nueva contraseña es requerida."),
             Length(
                 min=MIN_PASSWORD_LENGTH,
-                message=f"La contraseña debe tener al menos {MIN_PASSWORD_LENGTH} caracteres.",
+                message=_MSG_PASSWORD_LENGTH,
             ),
         ],
     )
@@ -158,7 +188,7 @@ class ChangePasswordForm(FlaskForm):
         "Confirmar Nueva Contraseña",
         validators=[
             DataRequired(message="Confirma tu nueva contraseña."),
-            EqualTo("new_password", message="Las contraseñas deben coincidir."),
+            EqualTo("new_password", message=_MSG_PASSWORDS_MATCH),
         ],
     )
 
@@ -217,16 +247,16 @@ class SessionForm(FlaskForm):
         coerce=int,
         validators=[DataRequired(message="Selecciona un paciente.")],
     )
-    session_date = DateField("Fecha", validators=[DataRequired(message="La fecha es requerida.")])
+    session_date = DateField("Fecha", validators=[DataRequired(message=_MSG_DATE_REQUIRED)])
     session_price = DecimalField(
         "Precio",
         places=2,
         validators=[
-            DataRequired(message="El precio es requerido."),
+            DataRequired(message=_MSG_PRICE_REQUIRED),
             NumberRange(
                 min=MIN_PRICE,
                 max=MAX_PRICE,
-                message=f"El precio debe estar entre ${MIN_PRICE} y ${MAX_PRICE:,.0f}.",
+                message=_MSG_PRICE_RANGE,
             ),
         ],
     )
@@ -235,27 +265,45 @@ class SessionForm(FlaskForm):
         "Notas",
         validators=[
             Optional(),
-            Length(
-                max=500,
-                message="Las notas son demasiado largas (máximo 500 caracteres).",
-            ),
+            Length(max=500, message=_MSG_SESSION_NOTES_LENGTH),
         ],
     )
 
+    @classmethod
+    def with_person_choices(cls) -> "SessionForm":
+        """
+        Create the form with patient choices populated.
+
+        The choices query runs at most once per request; the result is kept
+        on flask.g for any further form built during the same request.
+
+        Returns:
+            SessionForm with person_id choices set
+        """
+        from app.services.patient_service import PatientService
+
+        choices = g.get("person_choices")
+        if choices is None:
+            choices = g.person_choices = PatientService.get_for_select()
+
+        form = cls()
+        form.person_id.choices = choices
+        return form
+
 
 class EditSessionForm(FlaskForm):
     """Form for editing an existing therapy session."""
 
-    session_date = DateField("Fecha", validators=[DataRequired(message="La fecha es requerida.")])
+    session_date = DateField("Fecha", validators=[DataRequired(message=_MSG_DATE_REQUIRED)])
     session_price = DecimalField(
         "Precio",
         places=2,
         validators=[
-            DataRequired(message="El precio es requerido."),
+            DataRequired(message=_MSG_PRICE_REQUIRED),
             NumberRange(
                 min=MIN_PRICE,
                 max=MAX_PRICE,
-                message=f"El precio debe estar entre ${MIN_PRICE} y ${MAX_PRICE:,.0f}.",
+                message=_MSG_PRICE_RANGE,
             ),
         ],
     )
@@ -264,21 +312,19 @@ class EditSessionForm(FlaskForm):
         "Notas",
         validators=[
             Optional(),
-            Length(max=500, message="Las notas son demasiado largas."),
+            Length(max=500, message=_MSG_SESSION_NOTES_LENGTH),
         ],
     )
 
 
-class TogglePaymentForm(FlaskForm):
-    """Form for toggling session payment status (CSRF only)."""
+class _CSRFOnlyForm(FlaskForm):
+    """Form without fields, used only for CSRF validation."""
 
     pass
 
 
-class DeleteSessionForm(FlaskForm):
-    """Form for deleting a session (CSRF only)."""
-
-    pass
+# Toggling payment status and deleting a session only need the CSRF token
+TogglePaymentForm = DeleteSessionForm = _CSRFOnlyForm
 
 
 # =============================================================================
@@ -291,8 +337,8 @@ class FilterForm(FlaskForm):
 
     show = SelectField(
         "Mostrar",
-        choices=[("all", "Todos"), ("pending", "Pendientes"), ("paid", "Pagados")],
-        default="all",
+        choices=_FILTER_CHOICES,
+        default=ALL_FILTER,
     )
 
     class Meta:
@@ -311,16 +357,15 @@ class UserForm(FlaskForm):
     email = StringField(
         "Email",
         validators=[
-            DataRequired(message="El email es requerido."),
-            Email(message="Ingresa un email válido."),
-        ],
-    )
-    role = SelectField(
-        "Rol",
-        choices=[
-            ("therapist", "Terapeuta"),
-            ("admin", "Administrador"),
-            ("viewer", "Solo Lectura"),
+            DataRequired(message=_MSG_EMAIL_REQUIRED),
+            Email(message=_MSG_EMAIL_INVALID),
         ],
     )
+    # Choice membership is checked by validate_role with a set lookup
+    role = SelectField("Rol", choices=_ROLE_CHOICES, validate_choice=False)
     is_active = BooleanField("Activo", default=True)
+
+    def validate_role(self, field):
+        """Reject roles outside the known set."""
+        if field.data not in _VALID_ROLES:
+            raise ValidationError("Rol inválido.")
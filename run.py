@@ -2,6 +2,9 @@
 Application entry point for development.
 
 Run with: python run.py
+
+With FLASK_CONFIG=production the app is served by gunicorn instead of the
+Werkzeug dev server (worker counts via GUNICORN_WORKERS/GUNICORN_THREADS).
 """
 import os
 from app import create_app
@@ -11,13 +14,41 @@ config_name = os.environ.get('FLASK_CONFIG', 'development')
 app = create_app(config_name)
 
 
+def serve_with_gunicorn(host, port):
+    """
+    Serve the app with gunicorn using the same worker model as the Dockerfile.
+
+    Args:
+        host: Interface to bind
+        port: Port to bind
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class StandaloneApplication(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'{host}:{port}')
+            self.cfg.set('workers', int(os.environ.get('GUNICORN_WORKERS', 4)))
+            self.cfg.set('threads', int(os.environ.get('GUNICORN_THREADS', 2)))
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('accesslog', '-')
+            self.cfg.set('errorlog', '-')
+
+        def load(self):
+            return app
+
+    StandaloneApplication().run()
+
+
 if __name__ == '__main__':
     # Get host and port from environment
     host = os.environ.get('FLASK_HOST', '0.0.0.0')
     port = int(os.environ.get('FLASK_PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', 'True').lower() == 'true'
-    
-    print(f"""
+
+    if config_name.startswith('prod'):
+        serve_with_gunicorn(host, port)
+    else:
+        print(f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║        Therapy Session Management - Development Server       ║
 ╠══════════════════════════════════════════════════════════════╣
@@ -25,6 +56,6 @@ if __name__ == '__main__':
 ║  Config: {config_name}                                       
 ║  Debug:  {debug}                                             
 ╚══════════════════════════════════════════════════════════════╝
-    """)
-    
-    app.run(host=host, port=port, debug=debug)
+        """)
+
+        app.run(host=host, port=port, debug=debug)
@@ -5,32 +5,125 @@ Provides test fixtures for the entire test suite.
 """
 
 from datetime import date, timedelta
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
+from werkzeug.security import generate_password_hash
 
 from app import create_app
+from app.config import TestingConfig
 from app.extensions import db
 from app.models.person import Person
 from app.models.session import TherapySession
 from app.models.user import User
 
+# Fixture passwords are hashed once at import; check_password still verifies them for real
+TEST_PASSWORD_HASH = generate_password_hash("TestPass123", method=TestingConfig.PASSWORD_HASH_METHOD)
+ADMIN_PASSWORD_HASH = generate_password_hash("AdminPass123", method=TestingConfig.PASSWORD_HASH_METHOD)
 
-@pytest.fixture(scope="function")
+
+def pytest_addoption(parser):
+    """Register command line options for the test suite."""
+    parser.addoption(
+        "--no-screenshots",
+        action="store_true",
+        default=False,
+        help="Skip writing screenshots in frontend visual tests.",
+    )
+
+
+@pytest.fixture(scope="session")
 def app():
     """
     Create application for testing.
 
-    Uses in-memory SQLite database.
+    Uses in-memory SQLite database. The app and schema are created once per
+    test session; each test runs inside a rolled-back transaction (see db_session).
     """
     app = create_app("testing")
 
     with app.app_context():
+        _tune_sqlite(db.engine)
+        _enable_savepoints(db.engine)
         db.create_all()
-        yield app
-        db.session.remove()
+
+    yield app
+
+    with app.app_context():
         db.drop_all()
 
 
+def _tune_sqlite(engine):
+    """
+    Turn off durability work the throwaway test database does not need.
+
+    TestingConfig already uses ``sqlite:///:memory:``, which Flask-SQLAlchemy
+    pairs with a StaticPool so every connection shares one database.
+    """
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+def _enable_savepoints(engine):
+    """
+    Let pysqlite honour SAVEPOINT inside an outer transaction.
+
+    pysqlite emits BEGIN lazily and commits around SAVEPOINT, so transaction
+    control is taken over by SQLAlchemy instead.
+    """
+
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(autouse=True)
+def db_session(request, app):
+    """
+    Run each test inside a transaction that is rolled back afterwards.
+
+    Commits made by the code under test only release a SAVEPOINT, so no
+    data leaks between tests and the schema is never recreated.
+    ``join_transaction_mode="create_savepoint"`` restarts the SAVEPOINT after
+    each commit, which replaces the older ``after_transaction_end`` recipe.
+    Objects are not expired on commit, so fixtures hand them out without a
+    refresh.
+
+    Tests marked ``no_db`` only get the app context and no transaction; they
+    must not use the sample data fixtures.
+    """
+    with app.app_context():
+        if request.node.get_closest_marker("no_db"):
+            yield None
+            return
+
+        connection = db.engine.connect()
+        transaction = connection.begin()
+        original_session = db.session
+        db.session = scoped_session(
+            sessionmaker(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        )
+
+        yield db.session
+
+        db.session.remove()
+        db.session = original_session
+        transaction.rollback()
+        connection.close()
+
+
 @pytest.fixture
 def client(app):
     """Test client for making HTTP requests."""
@@ -44,77 +137,85 @@ def runner(app):
 
 
 @pytest.fixture
-def sample_user(app):
-    """Create a sample user for testing."""
-    with app.app_context():
-        user = User.create_user(email="test@example.com", password="TestPass123", role="therapist")
-        db.session.add(user)
-        db.session.commit()
+def seed(request, db_session):
+    """
+    Create the sample user, patient and session a test asks for in one commit.
 
-        # Refresh to get ID
-        db.session.refresh(user)
-        return user
+    Only the objects the test (directly or through other fixtures) requests
+    are created: sample_session implies sample_person, which implies
+    sample_user.
+    """
+    requested = set(request.fixturenames)
+    objects = SimpleNamespace(user=None, person=None, session=None)
+
+    objects.user = User(email="test@example.com", password_hash=TEST_PASSWORD_HASH, role="therapist")
+    db_session.add(objects.user)
+
+    if requested & {"sample_person", "sample_session"}:
+        # The user id is needed for created_by_id on both rows
+        db_session.flush()
+        objects.person = Person(name="Test Patient", notes="Test notes", created_by_id=objects.user.id)
+        db_session.add(objects.person)
+
+    if "sample_session" in requested:
+        objects.session = TherapySession(
+            person=objects.person,
+            session_date=date.today(),
+            session_price=100.00,
+            pending=True,
+            created_by_id=objects.user.id,
+        )
+        db_session.add(objects.session)
+
+    db_session.commit()
+    return objects
 
 
 @pytest.fixture
-def admin_user(app):
+def sample_user(seed):
+    """Create a sample user for testing."""
+    return seed.user
+
+
+@pytest.fixture
+def admin_user(db_session):
     """Create an admin user for testing."""
-    with app.app_context():
-        user = User.create_user(email="admin@example.com", password="AdminPass123", role="admin")
-        db.session.add(user)
-        db.session.commit()
-        db.session.refresh(user)
-        return user
+    user = User(email="admin@example.com", password_hash=ADMIN_PASSWORD_HASH, role="admin")
+    db_session.add(user)
+    db_session.commit()
+    return user
 
 
 @pytest.fixture
-def sample_person(app, sample_user):
+def sample_person(seed):
     """Create a sample patient for testing."""
-    with app.app_context():
-        person = Person(name="Test Patient", notes="Test notes", created_by_id=sample_user.id)
-        db.session.add(person)
-        db.session.commit()
-        db.session.refresh(person)
-        return person
+    return seed.person
 
 
 @pytest.fixture
-def sample_session(app, sample_person, sample_user):
+def sample_session(seed):
     """Create a sample therapy session for testing."""
-    with app.app_context():
-        session = TherapySession(
-            person_id=sample_person.id,
-            session_date=date.today(),
-            session_price=100.00,
-            pending=True,
-            created_by_id=sample_user.id,
-        )
-        db.session.add(session)
-        db.session.commit()
-        db.session.refresh(session)
-        return session
+    return seed.session
 
 
 @pytest.fixture
-def multiple_sessions(app, sample_person, sample_user):
+def multiple_sessions(db_session, sample_person, sample_user):
     """Create multiple therapy sessions for testing."""
-    with app.app_context():
-        sessions = []
-        for i in range(5):
-            session = TherapySession(
-                person_id=sample_person.id,
-                session_date=date.today() - timedelta(days=i * 7),
-                session_price=100.00 + (i * 10),
-                pending=(i % 2 == 0),  # Alternate pending/paid
-                created_by_id=sample_user.id,
-            )
-            db.session.add(session)
-            sessions.append(session)
-
-        db.session.commit()
-        for s in sessions:
-            db.session.refresh(s)
-        return sessions
+    sessions = [
+        TherapySession(
+            person_id=sample_person.id,
+            session_date=date.today() - timedelta(days=i * 7),
+            session_price=100.00 + (i * 10),
+            pending=(i % 2 == 0),  # Alternate pending/paid
+            created_by_id=sample_user.id,
+        )
+        for i in range(5)
+    ]
+
+    # Single multi-row INSERT; return_defaults populates the primary keys
+    db_session.bulk_save_objects(sessions, return_defaults=True)
+    db_session.commit()
+    return sessions
 
 
 class AuthActions:
@@ -142,6 +243,20 @@ def auth(client):
     return AuthActions(client)
 
 
+@pytest.fixture
+def authed_client(client, sample_user):
+    """
+    Client logged in as sample_user without going through the login form.
+
+    Writes Flask-Login's session keys directly, so no password is checked.
+    Tests that exercise the login endpoint itself use auth.login().
+    """
+    with client.session_transaction() as session:
+        session["_user_id"] = str(sample_user.id)
+        session["_fresh"] = True
+    return client
+
+
 @pytest.fixture
 def logged_in_client(client, sample_user, auth):
     """Client that is already logged in."""
@@ -5,21 +5,48 @@ Provides Playwright browser and page fixtures for frontend testing.
 """
 
 import os
+import time
 from datetime import date
+from importlib import resources
 
 import pytest
-from playwright.sync_api import sync_playwright
 
 from app import create_app
 from app.extensions import db
 from app.models.person import Person
 from app.models.session import TherapySession
 from app.models.user import User
+from tests.frontend.helpers import BASE_URL, DASHBOARD_URL, DEFAULT_TIMEOUT_MS, LOGIN_URL
+from tests.frontend.pages import LoginPage
 
+# Skip the whole frontend suite if Playwright is not available
+sync_api = pytest.importorskip("playwright.sync_api")
+expect = sync_api.expect
+sync_playwright = sync_api.sync_playwright
 
 # Screenshots directory
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), "screenshots")
 
+# Reuse a saved login across pytest runs for up to one hour
+AUTH_STATE_TTL = 60 * 60
+
+# Fail fast on actions and assertions (see DEFAULT_TIMEOUT_MS)
+expect.set_options(timeout=DEFAULT_TIMEOUT_MS)
+
+# Options shared by every browser context
+CONTEXT_OPTIONS = {
+    "base_url": BASE_URL,
+    "viewport": {"width": 1280, "height": 720},
+    "locale": "es-ES",
+}
+
+
+def _new_context(browser, **kwargs):
+    """Create a browser context with the shared options and action timeout."""
+    context = browser.new_context(**CONTEXT_OPTIONS, **kwargs)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    return context
+
 
 @pytest.fixture(scope="session")
 def screenshots_dir():
@@ -28,6 +55,23 @@ def screenshots_dir():
     return SCREENSHOTS_DIR
 
 
+@pytest.fixture(scope="session")
+def take_screenshot(request, screenshots_dir):
+    """
+    Save a viewport screenshot, unless --no-screenshots was given.
+
+    Returns:
+        Function taking (page, name) that writes <name>.png
+    """
+    enabled = not request.config.getoption("--no-screenshots")
+
+    def take(page, name):
+        if enabled:
+            page.screenshot(path=os.path.join(screenshots_dir, f"{name}.png"), full_page=False)
+
+    return take
+
+
 @pytest.fixture(scope="session")
 def app_config():
     """Application configuration for testing."""
@@ -64,18 +108,23 @@ def browser():
     headless = os.environ.get("PLAYWRIGHT_HEADLESS", "1") == "1"
     
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless)
+        browser = p.chromium.launch(
+            headless=headless,
+            args=["--disable-dev-shm-usage", "--no-sandbox"],
+        )
         yield browser
         browser.close()
 
 
 @pytest.fixture
 def context(browser):
-    """Create a new browser context for each test."""
-    context = browser.new_context(
-        viewport={"width": 1280, "height": 720},
-        locale="es-ES",
-    )
+    """
+    Create a new browser context for each test.
+
+    Contexts are cheap next to a browser launch and give each test clean
+    cookies and localStorage (the theme preference lives there).
+    """
+    context = _new_context(browser)
     yield context
     context.close()
 
@@ -88,6 +137,89 @@ def page(context):
     page.close()
 
 
+@pytest.fixture(scope="session")
+def axe_source():
+    """Read the axe-core bundle once per session."""
+    axe_package = pytest.importorskip("axe_playwright_python")
+    return (resources.files(axe_package) / "axe.min.js").read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def axe_page(browser, axe_source):
+    """
+    Create a page with axe-core available as window.axe.
+
+    The bundle is registered as an init script, so audits just call
+    axe.run() instead of re-injecting the script per navigation.
+    """
+    context = _new_context(browser)
+    context.add_init_script(axe_source)
+    page = context.new_page()
+    yield page
+    context.close()
+
+
+@pytest.fixture(scope="session")
+def axe_results():
+    """
+    Run an axe-core audit for a URL, reusing earlier results for that URL.
+
+    Returns:
+        Function taking (page, url) and returning the full axe results dict;
+        tests checking a single rule filter its violations by ``id``
+    """
+    cache = {}
+
+    def run(page, url):
+        if url not in cache:
+            page.goto(url)
+            cache[url] = page.evaluate("async () => await axe.run(document)")
+        return cache[url]
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def auth_state(request, browser, worker_id):
+    """
+    Log in once and return the resulting storage state.
+
+    The state is also saved in pytest's cache directory and reused by later
+    runs while it is younger than AUTH_STATE_TTL and the server still
+    accepts it; ``pytest --cache-clear`` forces a fresh login. Each xdist
+    worker keeps its own file so concurrent workers never read a half-written
+    one. Assumes the live server at BASE_URL has the test user.
+    """
+    cache = getattr(request.config, "cache", None)
+    state_file = cache.mkdir("playwright") / f"auth_state_{worker_id}.json" if cache is not None else None
+
+    if state_file is not None and state_file.exists() and time.time() - state_file.stat().st_mtime < AUTH_STATE_TTL:
+        context = _new_context(browser, storage_state=state_file)
+        page = context.new_page()
+        page.goto(DASHBOARD_URL)
+        # An expired session redirects to the login page
+        still_valid = LOGIN_URL not in page.url
+        context.close()
+        if still_valid:
+            return str(state_file)
+
+    context = _new_context(browser)
+    page = context.new_page()
+    LoginPage(page).login()
+    state = context.storage_state(path=state_file)
+    context.close()
+    return state
+
+
+@pytest.fixture
+def authenticated_page(browser, auth_state):
+    """Create a page in a fresh context that is already logged in."""
+    context = _new_context(browser, storage_state=auth_state)
+    page = context.new_page()
+    yield page
+    context.close()
+
+
 @pytest.fixture
 def auth_user(live_app):
     """Create and return a test user for authentication."""
@@ -150,20 +282,3 @@ def paid_session(live_app, patient, auth_user):
         db.session.commit()
         db.session.refresh(session)
         return session
-
-
-def login(page, base_url, email="test@example.com", password="test123"):
-    """
-    Helper function to log in a user.
-    
-    Args:
-        page: Playwright page
-        base_url: Application base URL
-        email: User email
-        password: User password
-    """
-    page.goto(f"{base_url}/auth/login")
-    page.fill("input[name='email']", email)
-    page.fill("input[name='password']", password)
-    page.click("button[type='submit']")
-    page.wait_for_url(f"{base_url}/patients/")
@@ -0,0 +1,32 @@
+"""
+Shared constants for frontend tests.
+
+Browser contexts are created with base_url=BASE_URL, so tests navigate with
+relative paths.
+"""
+
+import os
+
+BASE_URL = os.environ.get("FRONTEND_BASE_URL", "http://localhost:5000")
+LOGIN_URL = "/auth/login"
+DASHBOARD_URL = "/patients/"
+
+# Timeout policy: against a local server, actions and assertions should
+# resolve almost immediately, so a failing test fails after 1s instead of
+# Playwright's 5s default. Steps that wait on a CSS transition (modal fades,
+# carousel slides) pass ANIMATION_TIMEOUT_MS explicitly.
+DEFAULT_TIMEOUT_MS = 1000
+ANIMATION_TIMEOUT_MS = 2000
+
+TEST_EMAIL = "test@example.com"
+TEST_PASSWORD = "test123"
+
+# Summarizes every patient card on the dashboard in one DOM query
+PATIENT_CARDS_SCRIPT = """() => Array.from(document.querySelectorAll("[data-patient-id]")).map(card => {
+    const header = card.querySelector(".patient-card__name, .card-header");
+    return {
+        id: card.dataset.patientId,
+        headerVisible: header !== null && header.getBoundingClientRect().height > 0,
+        editable: card.querySelector("[data-patient-action='edit']") !== null,
+    };
+})"""
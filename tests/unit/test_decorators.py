@@ -0,0 +1,178 @@
+"""
+Unit tests for route decorators.
+"""
+
+import logging
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from flask import abort
+
+from app import create_app
+from app.extensions import db
+from app.models.user import User
+from app.utils.constants import UserRole
+from app.utils.decorators import (
+    admin_required,
+    confirmed_required,
+    handle_exceptions,
+    log_activity,
+    login_required_custom,
+    role_required,
+)
+
+
+@pytest.fixture
+def app():
+    """Fresh app per test, since these tests register throwaway routes."""
+    app = create_app("testing")
+
+    with app.app_context():
+        db.create_all()
+
+    return app
+
+
+@pytest.fixture
+def protected_app(app):
+    """App with throwaway routes guarded by each decorator."""
+
+    @login_required_custom
+    def login_view():
+        return "ok"
+
+    @admin_required
+    def admin_view():
+        return "ok"
+
+    @role_required(UserRole.ADMIN, UserRole.THERAPIST)
+    def role_view():
+        return "ok"
+
+    @confirmed_required
+    def confirmed_view():
+        return "ok"
+
+    app.add_url_rule("/_test/login", "test_login", login_view)
+    app.add_url_rule("/_test/admin", "test_admin", admin_view)
+    app.add_url_rule("/_test/role", "test_role", role_view)
+    app.add_url_rule("/_test/confirmed", "test_confirmed", confirmed_view)
+    return app
+
+
+class TestAccessDecorators:
+    """Tests for the access-control decorators."""
+
+    @pytest.mark.parametrize("path", ["/_test/login", "/_test/admin", "/_test/role", "/_test/confirmed"])
+    def test_anonymous_redirected_to_login(self, protected_app, client, path):
+        """Test that anonymous users are redirected to the login page."""
+        response = client.get(path)
+
+        assert response.status_code == 302
+        assert "/auth/login" in response.location
+        assert "next=" in response.location
+
+    def test_login_redirect_follows_script_root(self, protected_app, client):
+        """Test that the login redirect is built for each request's script root."""
+        prefixed = client.get("/_test/login", environ_overrides={"SCRIPT_NAME": "/tenant1"})
+        plain = client.get("/_test/login")
+
+        assert urlsplit(prefixed.location).path == "/tenant1/auth/login"
+        assert urlsplit(plain.location).path == "/auth/login"
+        assert parse_qs(urlsplit(plain.location).query)["next"] == ["http://localhost/_test/login"]
+
+    def test_therapist_passes_login_role_and_confirmed(self, protected_app, client, sample_user, auth):
+        """Test that a therapist passes non-admin checks."""
+        auth.login()
+
+        assert client.get("/_test/login").status_code == 200
+        assert client.get("/_test/role").status_code == 200
+        assert client.get("/_test/confirmed").status_code == 200
+
+    def test_therapist_forbidden_on_admin(self, protected_app, client, sample_user, auth):
+        """Test that a non-admin gets 403 on admin routes."""
+        auth.login()
+
+        assert client.get("/_test/admin").status_code == 403
+
+    def test_admin_allowed(self, protected_app, client, admin_user, auth):
+        """Test that an admin passes admin and role checks."""
+        auth.login(email="admin@example.com", password="AdminPass123")
+
+        assert client.get("/_test/admin").status_code == 200
+        assert client.get("/_test/role").status_code == 200
+
+    def test_role_not_allowed(self, protected_app, client, auth, caplog):
+        """Test that a viewer gets 403 on a therapist/admin route."""
+        viewer = User.create_user("viewer@example.com", "ViewerPass123", UserRole.VIEWER)
+        db.session.add(viewer)
+        db.session.commit()
+
+        auth.login(email="viewer@example.com", password="ViewerPass123")
+
+        with caplog.at_level(logging.WARNING, logger=protected_app.logger.name):
+            assert client.get("/_test/role").status_code == 403
+
+        assert "required roles: admin, therapist, user role: viewer" in caplog.text
+
+
+class TestLogActivity:
+    """Tests for the log_activity decorator."""
+
+    def test_logs_when_info_enabled(self, app, client, caplog):
+        """Test that the activity line is emitted at INFO level."""
+
+        @log_activity("Viewed test page")
+        def view():
+            return "ok"
+
+        app.add_url_rule("/_test/activity", "test_activity", view)
+
+        with caplog.at_level(logging.INFO, logger=app.logger.name):
+            assert client.get("/_test/activity").status_code == 200
+
+        assert "Activity: Viewed test page | User: anonymous | Path: /_test/activity | Method: GET" in caplog.text
+
+    def test_skips_logging_when_info_disabled(self, app, client, caplog):
+        """Test that nothing is logged when INFO is filtered out."""
+
+        @log_activity("Viewed test page")
+        def view():
+            return "ok"
+
+        app.add_url_rule("/_test/activity", "test_activity", view)
+
+        with caplog.at_level(logging.WARNING, logger=app.logger.name):
+            assert client.get("/_test/activity").status_code == 200
+
+        assert "Activity:" not in caplog.text
+
+
+class TestHandleExceptions:
+    """Tests for the handle_exceptions decorator."""
+
+    def test_unexpected_error_redirects(self, app, client):
+        """Test that unexpected errors are logged and redirected."""
+
+        @handle_exceptions
+        def view():
+            raise RuntimeError("boom")
+
+        app.add_url_rule("/_test/error", "test_error", view)
+
+        response = client.get("/_test/error")
+
+        assert response.status_code == 302
+
+    def test_http_exception_propagates(self, app, client):
+        """Test that abort() reaches Flask's error handlers."""
+
+        @handle_exceptions
+        def view():
+            abort(404)
+
+        app.add_url_rule("/_test/missing", "test_missing", view)
+
+        response = client.get("/_test/missing")
+
+        assert response.status_code == 404
@@ -0,0 +1,115 @@
+"""
+Unit tests for formatting utilities.
+"""
+
+from datetime import date, datetime
+
+from app.utils.formatters import format_date, format_datetime, format_percentage, format_price, truncate_text
+
+
+class TestFormatDate:
+    """Tests for format_date."""
+
+    def test_date_with_weekday(self):
+        """Test formatting a date object with Spanish weekday."""
+        assert format_date(date(2024, 1, 15)) == "Lunes 15/01/2024"
+
+    def test_date_without_weekday(self):
+        """Test formatting a date object without weekday."""
+        assert format_date(date(2024, 1, 5), include_weekday=False) == "05/01/2024"
+
+    def test_string_input(self):
+        """Test formatting a YYYY-MM-DD string."""
+        assert format_date("2024-03-10") == "Domingo 10/03/2024"
+        assert format_date("2024-03-10", include_weekday=False) == "10/03/2024"
+
+    def test_year_zero_padded(self):
+        """Test that years are always rendered with four digits."""
+        assert format_date(date(999, 12, 31), include_weekday=False) == "31/12/0999"
+
+    def test_invalid_string_returned_as_is(self):
+        """Test that unparseable strings are returned unchanged."""
+        assert format_date("not-a-date") == "not-a-date"
+
+    def test_none(self):
+        """Test that None formats as empty string."""
+        assert format_date(None) == ""
+
+
+class TestFormatPrice:
+    """Tests for format_price."""
+
+    def test_thousands_separator(self):
+        """Test grouping and fixed two decimals."""
+        assert format_price(1234.5) == "$1,234.50"
+        assert format_price(1234567.891) == "$1,234,567.89"
+
+    def test_small_values(self):
+        """Test values below one thousand."""
+        assert format_price(0) == "$0.00"
+        assert format_price(100) == "$100.00"
+        assert format_price(0.05) == "$0.05"
+
+    def test_negative(self):
+        """Test negative amounts keep the sign after the currency symbol."""
+        assert format_price(-1234.5) == "$-1,234.50"
+
+    def test_string_and_none(self):
+        """Test numeric strings, invalid strings and None."""
+        assert format_price("150") == "$150.00"
+        assert format_price("abc") == "$abc"
+        assert format_price(None) == "$0.00"
+
+
+class TestFormatDatetime:
+    """Tests for format_datetime."""
+
+    def test_datetime(self):
+        """Test formatting a datetime."""
+        assert format_datetime(datetime(2024, 1, 15, 9, 5)) == "15/01/2024 09:05"
+        assert format_datetime(datetime(999, 1, 15, 9, 5)) == "15/01/0999 09:05"
+
+    def test_none(self):
+        """Test that None formats as empty string."""
+        assert format_datetime(None) == ""
+
+
+class TestFormatPercentage:
+    """Tests for format_percentage."""
+
+    def test_default_precision(self):
+        """Test the default single decimal place."""
+        assert format_percentage(75.55) == f"{75.55:.1f}%"
+        assert format_percentage(50) == "50.0%"
+
+    def test_custom_precision(self):
+        """Test non-default decimal places."""
+        assert format_percentage(12.3456, decimal_places=2) == "12.35%"
+        assert format_percentage(12.3456, decimal_places=0) == "12%"
+
+    def test_invalid_value(self):
+        """Test that invalid input formats as 0%."""
+        assert format_percentage("abc") == "0%"
+        assert format_percentage(None) == "0%"
+
+
+class TestTruncateText:
+    """Tests for truncate_text."""
+
+    def test_short_text_unchanged(self):
+        """Test that text within the limit is returned unchanged."""
+        text = "Short text"
+        assert truncate_text(text) is text
+
+    def test_long_text_truncated(self):
+        """Test that long text is cut to max_length including the suffix."""
+        result = truncate_text("a" * 60, max_length=10)
+
+        assert result == "aaaaaaa..."
+        assert len(result) == 10
+
+    def test_custom_suffix_and_empty(self):
+        """Test custom suffix and empty/None input."""
+        assert truncate_text("abcdefghij", max_length=5, suffix="~") == "abcd~"
+        assert truncate_text("") == ""
+        assert truncate_text(None) is None
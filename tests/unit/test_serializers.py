@@ -0,0 +1,54 @@
+"""
+Unit tests for JSON serialization helpers.
+"""
+
+import json
+
+import pytest
+
+from app.utils import serializers
+from app.utils.serializers import dumps_json
+
+# Shaped like the old_values/new_values stored on AuditLog rows
+AUDIT_PAYLOAD = {
+    "name": "María José",
+    "price": 1500.5,
+    "pending": True,
+    "notes": None,
+    "session_ids": [1, 2, 3],
+    "changes": {"status": {"old": "pending", "new": "paid"}},
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test against the orjson path and the standard library fallback."""
+    if request.param == "orjson":
+        if serializers.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serializers, "orjson", None)
+    return request.param
+
+
+class TestDumpsJson:
+    """Tests for dumps_json."""
+
+    def test_returns_str(self, backend):
+        """Test that the result is a str, as the engine json_serializer expects."""
+        assert isinstance(dumps_json(AUDIT_PAYLOAD), str)
+
+    def test_audit_payload_round_trips(self, backend):
+        """Test that an audit log payload decodes back to the same values."""
+        assert json.loads(dumps_json(AUDIT_PAYLOAD)) == AUDIT_PAYLOAD
+
+    def test_non_str_keys_stringified(self, backend):
+        """Test that int keys are written as strings like json.dumps does."""
+        payload = {1: "a", "2": "b"}
+
+        assert json.loads(dumps_json(payload)) == json.loads(json.dumps(payload)) == {"1": "a", "2": "b"}
+
+    def test_unserializable_raises_type_error(self, backend):
+        """Test that unsupported values raise TypeError on both backends."""
+        with pytest.raises(TypeError):
+            dumps_json({"value": object()})
@@ -2,298 +2,334 @@
 Unit tests for service layer.
 """
 
+from collections import namedtuple
 from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.extensions import db
+from app.models.audit_log import AuditLog
 from app.models.person import Person
 from app.models.session import TherapySession
 from app.models.user import User
 from app.services.auth_service import AuthService
 from app.services.patient_service import PatientService
 from app.services.session_service import SessionService
+from app.utils.constants import AuditAction
+
+# Stand-in for TherapySession rows in tests of Python-side arithmetic
+FakeSession = namedtuple("FakeSession", ["pending", "session_price"])
 
 
 class TestAuthService:
     """Tests for the AuthService."""
 
-    def test_authenticate_success(self, app, sample_user):
+    def test_authenticate_success(self, sample_user):
         """Test successful authentication."""
-        with app.app_context():
-            success, user, message = AuthService.authenticate("test@example.com", "TestPass123")
+        success, user, message = AuthService.authenticate("test@example.com", "TestPass123")
 
-            assert success is True
-            assert user is not None
-            assert user.email == "test@example.com"
+        assert success is True
+        assert user is not None
+        assert user.email == "test@example.com"
 
-    def test_authenticate_wrong_password(self, app, sample_user):
+    def test_authenticate_wrong_password(self, sample_user):
         """Test authentication with wrong password."""
-        with app.app_context():
-            success, user, message = AuthService.authenticate("test@example.com", "WrongPassword")
+        success, user, message = AuthService.authenticate("test@example.com", "WrongPassword")
 
-            assert success is False
-            assert user is None
-            assert "incorrecto" in message.lower()
+        assert success is False
+        assert user is None
+        assert "incorrecto" in message.lower()
 
-    def test_authenticate_nonexistent_user(self, app):
+    def test_authenticate_nonexistent_user(self):
         """Test authentication with non-existent email."""
-        with app.app_context():
-            success, user, message = AuthService.authenticate("nonexistent@example.com", "password")
+        success, user, message = AuthService.authenticate("nonexistent@example.com", "password")
 
-            assert success is False
-            assert user is None
+        assert success is False
+        assert user is None
 
-    def test_authenticate_inactive_user(self, app, sample_user):
+    def test_authenticate_inactive_user(self, sample_user):
         """Test authentication with inactive user."""
-        with app.app_context():
-            user = User.query.get(sample_user.id)
-            user.is_active = False
-            db.session.commit()
+        user = User.query.get(sample_user.id)
+        user.is_active = False
+        db.session.commit()
 
-            success, _, message = AuthService.authenticate("test@example.com", "TestPass123")
+        success, _, message = AuthService.authenticate("test@example.com", "TestPass123")
 
-            assert success is False
-            assert "desactivada" in message.lower()
+        assert success is False
+        assert "desactivada" in message.lower()
 
-    def test_register_success(self, app):
+    def test_register_success(self):
         """Test successful registration."""
-        with app.app_context():
-            success, user, message = AuthService.register("new@example.com", "NewPass123")
+        success, user, message = AuthService.register("new@example.com", "NewPass123")
 
-            assert success is True
-            assert user is not None
-            assert user.email == "new@example.com"
+        assert success is True
+        assert user is not None
+        assert user.email == "new@example.com"
 
-    def test_register_duplicate_email(self, app, sample_user):
+    def test_register_duplicate_email(self, sample_user):
         """Test registration with existing email."""
-        with app.app_context():
-            success, user, message = AuthService.register("test@example.com", "password")  # Already exists
+        success, user, message = AuthService.register("test@example.com", "password")  # Already exists
 
-            assert success is False
-            assert "registrado" in message.lower()
+        assert success is False
+        assert "registrado" in message.lower()
 
-    def test_change_password_success(self, app, sample_user):
+    def test_change_password_success(self, sample_user):
         """Test successful password change."""
-        with app.app_context():
-            user = User.query.get(sample_user.id)
+        user = User.query.get(sample_user.id)
 
-            success, message = AuthService.change_password(user, "TestPass123", "NewPass456")
+        success, message = AuthService.change_password(user, "TestPass123", "NewPass456")
 
-            assert success is True
-            assert user.check_password("NewPass456") is True
+        assert success is True
+        assert user.check_password("NewPass456") is True
 
-    def test_change_password_wrong_current(self, app, sample_user):
+    def test_change_password_wrong_current(self, sample_user):
         """Test password change with wrong current password."""
-        with app.app_context():
-            user = User.query.get(sample_user.id)
+        user = User.query.get(sample_user.id)
 
-            success, message = AuthService.change_password(user, "WrongPassword", "NewPass456")
+        success, message = AuthService.change_password(user, "WrongPassword", "NewPass456")
 
-            assert success is False
-            assert "incorrecta" in message.lower()
+        assert success is False
+        assert "incorrecta" in message.lower()
 
 
 class TestPatientService:
     """Tests for the PatientService."""
 
-    def test_create_patient_success(self, app, sample_user):
+    def test_create_patient_success(self, sample_user):
         """Test successful patient creation."""
-        with app.app_context():
-            success, person, message = PatientService.create(name="New Patient", user_id=sample_user.id)
+        success, person, message = PatientService.create(name="New Patient", user_id=sample_user.id)
 
-            assert success is True
-            assert person is not None
-            assert person.name == "New Patient"
+        assert success is True
+        assert person is not None
+        assert person.name == "New Patient"
 
-    def test_create_patient_empty_name(self, app):
+    @pytest.mark.no_db
+    def test_create_patient_empty_name(self):
         """Test patient creation with empty name."""
-        with app.app_context():
-            success, person, message = PatientService.create(name="")
+        success, person, message = PatientService.create(name="")
 
-            assert success is False
-            assert "requerido" in message.lower()
+        assert success is False
+        assert "requerido" in message.lower()
 
-    def test_create_patient_duplicate(self, app, sample_person):
+    def test_create_patient_duplicate(self, sample_person):
         """Test patient creation with duplicate name."""
-        with app.app_context():
-            success, person, message = PatientService.create(name="Test Patient")
+        success, person, message = PatientService.create(name="Test Patient")
 
-            assert success is False
-            assert "existe" in message.lower()
+        assert success is False
+        assert "existe" in message.lower()
 
-    def test_get_by_id(self, app, sample_person):
+    def test_get_by_id(self, sample_person):
         """Test getting patient by ID."""
-        with app.app_context():
-            person = PatientService.get_by_id(sample_person.id)
+        person = PatientService.get_by_id(sample_person.id)
 
-            assert person is not None
-            assert person.name == "Test Patient"
+        assert person is not None
+        assert person.name == "Test Patient"
 
-    def test_get_by_id_not_found(self, app):
+    def test_get_by_id_not_found(self):
         """Test getting non-existent patient."""
-        with app.app_context():
-            person = PatientService.get_by_id(99999)
+        person = PatientService.get_by_id(99999)
 
-            assert person is None
+        assert person is None
 
-    def test_update_patient_success(self, app, sample_person, sample_user):
+    def test_update_patient_success(self, sample_person, sample_user):
         """Test successful patient update."""
-        with app.app_context():
-            success, person, message = PatientService.update(
-                person_id=sample_person.id, name="Updated Name", user_id=sample_user.id
-            )
+        success, person, message = PatientService.update(
+            person_id=sample_person.id, name="Updated Name", user_id=sample_user.id
+        )
 
-            assert success is True
-            assert person.name == "Updated Name"
+        assert success is True
+        assert person.name == "Updated Name"
 
-    def test_delete_patient_soft(self, app, sample_person, sample_user):
+    def test_delete_patient_soft(self, sample_person, sample_user):
         """Test soft deleting a patient."""
-        with app.app_context():
-            success, message = PatientService.delete(person_id=sample_person.id, user_id=sample_user.id, soft=True)
+        success, message = PatientService.delete(person_id=sample_person.id, user_id=sample_user.id, soft=True)
+
+        assert success is True
+
+        # Should not be in active query
+        person = PatientService.get_by_id(sample_person.id)
+        assert person is None
+
+        # But should still exist in database
+        person = Person.query.get(sample_person.id)
+        assert person is not None
+        assert person.is_deleted is True
+
+    def test_delete_patient_soft_audits_sessions(self, sample_person, sample_user, multiple_sessions):
+        """Test soft delete writes one audit entry per cascaded session."""
+        success, message = PatientService.delete(person_id=sample_person.id, user_id=sample_user.id, soft=True)
+
+        assert success is True
+
+        entries = AuditLog.query.filter_by(table_name="therapy_sessions", action=AuditAction.SOFT_DELETE).all()
+        assert sorted(e.record_id for e in entries) == sorted(s.id for s in multiple_sessions)
+        assert all(e.user_id == sample_user.id for e in entries)
+
+    def test_delete_patient_soft_skips_deleted_sessions(self, sample_person, sample_user, multiple_sessions):
+        """Test soft delete leaves already-deleted sessions and their audit trail alone."""
+        already_deleted = db.session.get(TherapySession, multiple_sessions[0].id)
+        already_deleted.soft_delete(sample_user.id)
+        db.session.commit()
+        original_deleted_at = already_deleted.deleted_at
 
-            assert success is True
+        success, message = PatientService.delete(person_id=sample_person.id, user_id=sample_user.id, soft=True)
 
-            # Should not be in active query
-            person = PatientService.get_by_id(sample_person.id)
-            assert person is None
+        assert success is True
+        db.session.refresh(already_deleted)
+        assert already_deleted.deleted_at == original_deleted_at
 
-            # But should still exist in database
-            person = Person.query.get(sample_person.id)
-            assert person is not None
-            assert person.is_deleted is True
+        entries = AuditLog.query.filter_by(table_name="therapy_sessions", action=AuditAction.SOFT_DELETE).all()
+        assert sorted(e.record_id for e in entries) == sorted(s.id for s in multiple_sessions[1:])
 
-    def test_get_for_select(self, app, sample_person):
+    def test_get_dashboard_data(self, sample_person, multiple_sessions):
+        """Test dashboard grouping and session totals."""
+        data = PatientService.get_dashboard_data()
+
+        assert data["total"] == 5
+        person_id, name, sessions = data["persons"][0]
+        assert (person_id, name) == (sample_person.id, "Test Patient")
+        assert len(sessions) == 5
+
+        pending = PatientService.get_dashboard_data("pending")
+        assert pending["total"] == 3
+
+    def test_get_dashboard_data_patient_without_sessions(self, sample_person):
+        """Test that patients with no sessions are still listed."""
+        data = PatientService.get_dashboard_data()
+
+        assert data["total"] == 0
+        assert data["persons"] == [(sample_person.id, "Test Patient", [])]
+
+    def test_get_for_select(self, sample_person):
         """Test getting patients for dropdown."""
-        with app.app_context():
-            choices = PatientService.get_for_select()
+        choices = PatientService.get_for_select()
+
+        assert choices == [(sample_person.id, "Test Patient")]
 
-            assert len(choices) >= 1
-            assert any(c[1] == "Test Patient" for c in choices)
+    def test_get_for_select_excludes_deleted(self, sample_person):
+        """Test that soft-deleted patients are not offered."""
+        sample_person.soft_delete()
+        db.session.commit()
+
+        assert PatientService.get_for_select() == []
 
 
 class TestSessionService:
     """Tests for the SessionService."""
 
-    def test_create_session_success(self, app, sample_person, sample_user):
+    def test_create_session_success(self, sample_person, sample_user):
         """Test successful session creation."""
-        with app.app_context():
-            success, session, message = SessionService.create(
-                person_id=sample_person.id,
-                session_date=date.today(),
-                session_price=150.00,
-                user_id=sample_user.id,
-            )
-
-            assert success is True
-            assert session is not None
-            assert session.session_price == 150.00
-
-    def test_create_session_negative_price(self, app, sample_person):
+        success, session, message = SessionService.create(
+            person_id=sample_person.id,
+            session_date=date.today(),
+            session_price=150.00,
+            user_id=sample_user.id,
+        )
+
+        assert success is True
+        assert session is not None
+        assert session.session_price == 150.00
+
+    def test_create_session_negative_price(self, sample_person):
         """Test session creation with negative price."""
-        with app.app_context():
-            success, session, message = SessionService.create(
-                person_id=sample_person.id,
-                session_date=date.today(),
-                session_price=-100.00,
-            )
+        success, session, message = SessionService.create(
+            person_id=sample_person.id,
+            session_date=date.today(),
+            session_price=-100.00,
+        )
 
-            assert success is False
-            assert "mayor a cero" in message.lower()
+        assert success is False
+        assert "mayor a cero" in message.lower()
 
-    def test_create_session_zero_price(self, app, sample_person):
+    def test_create_session_zero_price(self, sample_person):
         """Test session creation with zero price."""
-        with app.app_context():
-            success, session, message = SessionService.create(
-                person_id=sample_person.id, session_date=date.today(), session_price=0
-            )
+        success, session, message = SessionService.create(
+            person_id=sample_person.id, session_date=date.today(), session_price=0
+        )
 
-            assert success is False
+        assert success is False
 
-    def test_create_session_far_future_date(self, app, sample_person):
+    def test_create_session_far_future_date(self, sample_person):
         """Test session creation with date too far in future."""
-        with app.app_context():
-            future_date = date.today() + timedelta(days=30)
+        future_date = date.today() + timedelta(days=30)
 
-            success, session, message = SessionService.create(
-                person_id=sample_person.id,
-                session_date=future_date,
-                session_price=100.00,
-            )
+        success, session, message = SessionService.create(
+            person_id=sample_person.id,
+            session_date=future_date,
+            session_price=100.00,
+        )
 
-            assert success is False
-            assert "anticipación" in message.lower()
+        assert success is False
+        assert "anticipación" in message.lower()
 
-    def test_create_session_invalid_person(self, app):
+    def test_create_session_invalid_person(self):
         """Test session creation with non-existent patient."""
-        with app.app_context():
-            success, session, message = SessionService.create(
-                person_id=99999, session_date=date.today(), session_price=100.00
-            )
+        success, session, message = SessionService.create(
+            person_id=99999, session_date=date.today(), session_price=100.00
+        )
 
-            assert success is False
-            assert "no encontrado" in message.lower()
+        assert success is False
+        assert "no encontrado" in message.lower()
 
-    def test_update_session_success(self, app, sample_session, sample_user):
+    def test_update_session_success(self, sample_session, sample_user):
         """Test successful session update."""
-        with app.app_context():
-            new_date = date.today() - timedelta(days=1)
+        new_date = date.today() - timedelta(days=1)
 
-            success, session, message = SessionService.update(
-                session_id=sample_session.id,
-                session_date=new_date,
-                session_price=200.00,
-                user_id=sample_user.id,
-            )
+        success, session, message = SessionService.update(
+            session_id=sample_session.id,
+            session_date=new_date,
+            session_price=200.00,
+            user_id=sample_user.id,
+        )
 
-            assert success is True
-            assert session.session_price == 200.00
+        assert success is True
+        assert session.session_price == 200.00
 
-    def test_toggle_payment_status(self, app, sample_session, sample_user):
+    def test_toggle_payment_status(self, sample_session, sample_user):
         """Test toggling payment status."""
-        with app.app_context():
-            # Initially pending
-            success, new_status, message = SessionService.toggle_payment_status(
-                session_id=sample_session.id, user_id=sample_user.id
-            )
+        # Initially pending
+        success, new_status, message = SessionService.toggle_payment_status(
+            session_id=sample_session.id, user_id=sample_user.id
+        )
 
-            assert success is True
-            assert new_status is False  # Now paid
+        assert success is True
+        assert new_status is False  # Now paid
 
-            # Toggle again
-            success, new_status, message = SessionService.toggle_payment_status(
-                session_id=sample_session.id, user_id=sample_user.id
-            )
+        # Toggle again
+        success, new_status, message = SessionService.toggle_payment_status(
+            session_id=sample_session.id, user_id=sample_user.id
+        )
 
-            assert success is True
-            assert new_status is True  # Now pending again
+        assert success is True
+        assert new_status is True  # Now pending again
 
-    def test_delete_session_soft(self, app, sample_session, sample_user):
+    def test_delete_session_soft(self, sample_session, sample_user):
         """Test soft deleting a session."""
-        with app.app_context():
-            success, message = SessionService.delete(session_id=sample_session.id, user_id=sample_user.id, soft=True)
+        success, message = SessionService.delete(session_id=sample_session.id, user_id=sample_user.id, soft=True)
 
-            assert success is True
+        assert success is True
 
-            # Should not be in active query
-            session = SessionService.get_by_id(sample_session.id)
-            assert session is None
+        # Should not be in active query
+        session = SessionService.get_by_id(sample_session.id)
+        assert session is None
 
-    def test_calculate_totals(self, app, sample_person, multiple_sessions):
+    @pytest.mark.no_db
+    def test_calculate_totals(self):
         """Test calculating payment totals."""
-        with app.app_context():
-            totals = SessionService.calculate_totals(sample_person.id)
+        sessions = [FakeSession(pending=i % 2 == 0, session_price=100.00 + i * 10) for i in range(5)]
+
+        with patch.object(TherapySession, "query_active") as query_active:
+            query_active.return_value.filter_by.return_value.all.return_value = sessions
+            totals = SessionService.calculate_totals(person_id=1)
 
-            assert "pending_total" in totals
-            assert "paid_total" in totals
-            assert "grand_total" in totals
+        query_active.return_value.filter_by.assert_called_once_with(person_id=1)
 
-            # Pending: 100 + 120 + 140 = 360
-            assert totals["pending_total"] == 360
+        # Pending: 100 + 120 + 140 = 360
+        assert totals["pending_total"] == 360
 
-            # Paid: 110 + 130 = 240
-            assert totals["paid_total"] == 240
+        # Paid: 110 + 130 = 240
+        assert totals["paid_total"] == 240
 
-            # Total: 600
-            assert totals["grand_total"] == 600
+        # Total: 600
+        assert totals["grand_total"] == 600
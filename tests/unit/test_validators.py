@@ -3,6 +3,7 @@ Unit tests for form validators.
 """
 
 from datetime import date
+from unittest.mock import patch
 
 import pytest
 
@@ -12,217 +13,257 @@ from app.validators.forms import (
     PersonForm,
     RegistrationForm,
     SessionForm,
+    UserForm,
 )
 
+# Read once so every session form in the module sees the same date
+TODAY = date.today()
+
 
 class TestLoginForm:
     """Tests for the LoginForm."""
 
-    def test_valid_login_data(self, app):
+    def test_valid_login_data(self):
         """Test form with valid data."""
-        with app.app_context():
-            form = LoginForm(data={"email": "test@example.com", "password": "password123"})
+        form = LoginForm(data={"email": "test@example.com", "password": "password123"})
 
-            assert form.validate() is True
+        assert form.validate() is True
 
-    def test_missing_email(self, app):
+    def test_missing_email(self):
         """Test form with missing email."""
-        with app.app_context():
-            form = LoginForm(data={"password": "password123"})
+        form = LoginForm(data={"password": "password123"})
 
-            assert form.validate() is False
-            assert "email" in form.errors
+        assert form.validate() is False
+        assert "email" in form.errors
 
-    def test_invalid_email_format(self, app):
+    def test_invalid_email_format(self):
         """Test form with invalid email format."""
-        with app.app_context():
-            form = LoginForm(data={"email": "not-an-email", "password": "password123"})
+        form = LoginForm(data={"email": "not-an-email", "password": "password123"})
 
-            assert form.validate() is False
-            assert "email" in form.errors
+        assert form.validate() is False
+        assert "email" in form.errors
 
-    def test_missing_password(self, app):
+    def test_missing_password(self):
         """Test form with missing password."""
-        with app.app_context():
-            form = LoginForm(data={"email": "test@example.com"})
+        form = LoginForm(data={"email": "test@example.com"})
 
-            assert form.validate() is False
-            assert "password" in form.errors
+        assert form.validate() is False
+        assert "password" in form.errors
 
 
 class TestRegistrationForm:
     """Tests for the RegistrationForm."""
 
-    def test_valid_registration_data(self, app):
+    def test_valid_registration_data(self):
         """Test form with valid data."""
-        with app.app_context():
-            form = RegistrationForm(
-                data={
-                    "email": "new@example.com",
-                    "password": "SecurePass1",
-                    "confirm_password": "SecurePass1",
-                }
-            )
-
-            assert form.validate() is True
-
-    def test_password_mismatch(self, app):
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "SecurePass1",
+                "confirm_password": "SecurePass1",
+            }
+        )
+
+        assert form.validate() is True
+
+    def test_password_mismatch(self):
         """Test form with mismatched passwords."""
-        with app.app_context():
-            form = RegistrationForm(
-                data={
-                    "email": "new@example.com",
-                    "password": "SecurePass1",
-                    "confirm_password": "DifferentPass1",
-                }
-            )
-
-            assert form.validate() is False
-            assert "confirm_password" in form.errors
-
-    def test_password_too_short(self, app):
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "SecurePass1",
+                "confirm_password": "DifferentPass1",
+            }
+        )
+
+        assert form.validate() is False
+        assert "confirm_password" in form.errors
+
+    def test_password_too_short(self):
         """Test form with password too short."""
-        with app.app_context():
-            form = RegistrationForm(
-                data={
-                    "email": "new@example.com",
-                    "password": "short",
-                    "confirm_password": "short",
-                }
-            )
-
-            assert form.validate() is False
-            assert "password" in form.errors
-
-    def test_password_without_number(self, app):
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "short",
+                "confirm_password": "short",
+            }
+        )
+
+        assert form.validate() is False
+        assert "password" in form.errors
+
+    def test_password_without_number(self):
         """Test form with password without numbers."""
-        with app.app_context():
-            form = RegistrationForm(
-                data={
-                    "email": "new@example.com",
-                    "password": "NoNumbersHere",
-                    "confirm_password": "NoNumbersHere",
-                }
-            )
-
-            assert form.validate() is False
-            assert "password" in form.errors
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "NoNumbersHere",
+                "confirm_password": "NoNumbersHere",
+            }
+        )
+
+        assert form.validate() is False
+        assert "password" in form.errors
+
+    def test_password_without_letter(self):
+        """Test form with password without letters."""
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "1234567890",
+                "confirm_password": "1234567890",
+            }
+        )
+
+        assert form.validate() is False
+        assert "password" in form.errors
+
+    def test_password_with_non_ascii_letters(self):
+        """Test that accented letters count as letters."""
+        form = RegistrationForm(
+            data={
+                "email": "new@example.com",
+                "password": "ñandú12345",
+                "confirm_password": "ñandú12345",
+            }
+        )
+
+        assert form.validate() is True
 
 
 class TestPersonForm:
     """Tests for the PersonForm."""
 
-    def test_valid_person_data(self, app):
+    def test_valid_person_data(self):
         """Test form with valid data."""
-        with app.app_context():
-            form = PersonForm(data={"name": "John Doe"})
+        form = PersonForm(data={"name": "John Doe"})
 
-            assert form.validate() is True
+        assert form.validate() is True
 
-    def test_missing_name(self, app):
+    def test_missing_name(self):
         """Test form with missing name."""
-        with app.app_context():
-            form = PersonForm(data={})
+        form = PersonForm(data={})
 
-            assert form.validate() is False
-            assert "name" in form.errors
+        assert form.validate() is False
+        assert "name" in form.errors
 
-    def test_name_too_short(self, app):
+    def test_name_too_short(self):
         """Test form with name too short."""
-        with app.app_context():
-            form = PersonForm(data={"name": "X"})
+        form = PersonForm(data={"name": "X"})
 
-            assert form.validate() is False
-            assert "name" in form.errors
+        assert form.validate() is False
+        assert "name" in form.errors
 
-    def test_name_with_notes(self, app):
+    def test_name_with_notes(self):
         """Test form with optional notes."""
-        with app.app_context():
-            form = PersonForm(data={"name": "John Doe", "notes": "Some notes about the patient"})
+        form = PersonForm(data={"name": "John Doe", "notes": "Some notes about the patient"})
 
-            assert form.validate() is True
+        assert form.validate() is True
 
 
 class TestSessionForm:
     """Tests for the SessionForm."""
 
-    def test_valid_session_data(self, app):
+    def test_valid_session_data(self):
         """Test form with valid data."""
-        with app.app_context():
-            form = SessionForm(
-                data={
-                    "person_id": 1,
-                    "session_date": date.today(),
-                    "session_price": 100.00,
-                }
-            )
-            form.person_id.choices = [(1, "Test Patient")]
-
-            assert form.validate() is True
-
-    def test_missing_person_id(self, app):
+        form = SessionForm(
+            data={
+                "person_id": 1,
+                "session_date": TODAY,
+                "session_price": 100.00,
+            }
+        )
+        form.person_id.choices = [(1, "Test Patient")]
+
+        assert form.validate() is True
+
+    def test_missing_person_id(self):
         """Test form with missing patient."""
-        with app.app_context():
-            form = SessionForm(data={"session_date": date.today(), "session_price": 100.00})
-            # Need to set choices before validating SelectField
-            form.person_id.choices = [(1, "Test Patient")]
+        form = SessionForm(data={"session_date": TODAY, "session_price": 100.00})
+        # Need to set choices before validating SelectField
+        form.person_id.choices = [(1, "Test Patient")]
 
-            assert form.validate() is False
-            assert "person_id" in form.errors
+        assert form.validate() is False
+        assert "person_id" in form.errors
 
-    def test_negative_price(self, app):
+    def test_negative_price(self):
         """Test form with negative price."""
-        with app.app_context():
-            form = SessionForm(
-                data={
-                    "person_id": 1,
-                    "session_date": date.today(),
-                    "session_price": -50.00,
-                }
-            )
-            form.person_id.choices = [(1, "Test Patient")]
-
-            assert form.validate() is False
-            assert "session_price" in form.errors
-
-    def test_price_too_high(self, app):
+        form = SessionForm(
+            data={
+                "person_id": 1,
+                "session_date": TODAY,
+                "session_price": -50.00,
+            }
+        )
+        form.person_id.choices = [(1, "Test Patient")]
+
+        assert form.validate() is False
+        assert "session_price" in form.errors
+
+    def test_price_too_high(self):
         """Test form with price exceeding maximum."""
-        with app.app_context():
-            form = SessionForm(
-                data={
-                    "person_id": 1,
-                    "session_date": date.today(),
-                    "session_price": 2000000.00,  # Over MAX_PRICE
-                }
-            )
-            form.person_id.choices = [(1, "Test Patient")]
+        form = SessionForm(
+            data={
+                "person_id": 1,
+                "session_date": TODAY,
+                "session_price": 2000000.00,  # Over MAX_PRICE
+            }
+        )
+        form.person_id.choices = [(1, "Test Patient")]
+
+        assert form.validate() is False
+        assert "session_price" in form.errors
+
+    def test_with_person_choices(self, app, sample_person):
+        """Test that patient choices are loaded once per request."""
+        with app.test_request_context():
+            form = SessionForm.with_person_choices()
+            assert form.person_id.choices == [(sample_person.id, "Test Patient")]
+
+            with patch("app.services.patient_service.PatientService.get_for_select") as get_for_select:
+                again = SessionForm.with_person_choices()
 
-            assert form.validate() is False
-            assert "session_price" in form.errors
+            get_for_select.assert_not_called()
+            assert again.person_id.choices == form.person_id.choices
 
 
 class TestEditSessionForm:
     """Tests for the EditSessionForm."""
 
-    def test_valid_edit_data(self, app):
+    def test_valid_edit_data(self):
         """Test form with valid data."""
-        with app.app_context():
-            form = EditSessionForm(data={"session_date": date.today(), "session_price": 150.00})
+        form = EditSessionForm(data={"session_date": TODAY, "session_price": 150.00})
 
-            assert form.validate() is True
+        assert form.validate() is True
 
-    def test_missing_date(self, app):
+    def test_missing_date(self):
         """Test form with missing date."""
-        with app.app_context():
-            form = EditSessionForm(data={"session_price": 150.00})
+        form = EditSessionForm(data={"session_price": 150.00})
 
-            assert form.validate() is False
-            assert "session_date" in form.errors
+        assert form.validate() is False
+        assert "session_date" in form.errors
 
-    def test_missing_price(self, app):
+    def test_missing_price(self):
         """Test form with missing price."""
-        with app.app_context():
-            form = EditSessionForm(data={"session_date": date.today()})
+        form = EditSessionForm(data={"session_date": TODAY})
+
+        assert form.validate() is False
+        assert "session_price" in form.errors
+
+
+class TestUserForm:
+    """Tests for the UserForm."""
+
+    @pytest.mark.parametrize("role", ["therapist", "admin", "viewer"])
+    def test_valid_roles(self, role):
+        """Test that every known role is accepted."""
+        form = UserForm(data={"email": "user@example.com", "role": role})
+
+        assert form.validate() is True
+
+    def test_invalid_role(self):
+        """Test that unknown roles are rejected."""
+        form = UserForm(data={"email": "user@example.com", "role": "superuser"})
 
-            assert form.validate() is False
-            assert "session_price" in form.errors
+        assert form.validate() is False
+        assert "role" in form.errors
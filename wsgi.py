@@ -6,10 +6,27 @@ Use with gunicorn:
 
 Or with uWSGI:
     uwsgi --http :8000 --module wsgi:app --processes 4
+
+Servers that load an application factory can use ``wsgi:get_app()`` instead.
 """
 import os
+from functools import lru_cache
+
 from app import create_app
 
 # Get configuration from environment variable
 config_name = os.environ.get('FLASK_CONFIG', 'production')
-app = create_app(config_name)
+
+
+@lru_cache(maxsize=None)
+def _build_app(name):
+    """Build the application for a resolved configuration name."""
+    return create_app(name)
+
+
+def get_app(name=None):
+    """Return the application for a configuration, building it once per process."""
+    return _build_app(name or config_name)
+
+
+app = get_app()